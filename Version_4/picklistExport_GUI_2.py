@@ -11,9 +11,12 @@ import sys
 import time
 import requests
 import tkinter as tk 
+import asyncio
 import threading
-import queue
+import collections
+import bisect
 from datetime import datetime, timedelta
+from itertools import compress, repeat
 from typing import List, Dict, Optional, Tuple, Set
 
 # Third-party libraries
@@ -36,6 +39,7 @@ ctk.set_default_color_theme("blue")
 
 API_VERSION = '65.0'
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+POPULATE_CHUNK_SIZE = 500  # Listbox rows inserted per idle callback when populating
 
 # ===========================================
 # HELPER CLASSES 
@@ -387,6 +391,11 @@ def format_runtime(seconds: float) -> str:
     minutes, seconds = divmod(remainder, 60)
     return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
 
+def filter_contains(names: List[str], names_lower: List[str], term: str) -> Tuple[List[str], List[str]]:
+    """Returns (names, names_lower) for entries whose lowercased form contains term; runs entirely in C iterators"""
+    mask = list(map(str.__contains__, names_lower, repeat(term)))
+    return list(compress(names, mask)), list(compress(names_lower, mask))
+
 def print_statistics(stats: Dict, runtime_formatted: str, output_file: str):
     """Prints comprehensive statistics to the console"""
     print("\n" + "=" * 70)
@@ -417,6 +426,14 @@ def print_statistics(stats: Dict, runtime_formatted: str, output_file: str):
 # GUI IMPLEMENTATION
 # ===========================================
 
+# One allocation per queued message. Status lines use kind "status" or "verbose"
+# with the message string as payload, so no inner (message, verbose) tuple is built.
+Msg = collections.namedtuple('Msg', 'kind payload')
+
+# Keys that only move the cursor/view in the read-only status textbox
+_STATUS_NAVIGATION_KEYS = frozenset(("Left", "Right", "Up", "Down", "Home", "End", "Prior", "Next",
+                                     "Shift_L", "Shift_R", "Control_L", "Control_R", "Meta_L", "Meta_R"))
+
 class PicklistExportGUI(ctk.CTk):
     def __init__(self):
         super().__init__()
@@ -425,51 +442,137 @@ class PicklistExportGUI(ctk.CTk):
         self.geometry("1200x768")
         self.minsize(1000, 600)
         
+        # Shared fonts (each CTkFont registers a Tcl font, so build them once)
+        self._font_title = ctk.CTkFont(size=30, weight="bold")
+        self._font_header = ctk.CTkFont(size=24, weight="bold")
+        self._font_h2 = ctk.CTkFont(size=16, weight="bold")
+        self._font_button = ctk.CTkFont(size=15, weight="bold")
+        self._font_label_bold = ctk.CTkFont(size=14, weight="bold")
+        self._font_label = ctk.CTkFont(size=14)
+        self._font_h3 = ctk.CTkFont(size=13, weight="bold")
+        self._font_small = ctk.CTkFont(size=13)
+        
         self.sf_exporter: Optional[PicklistExporter] = None
         self.all_org_objects: List[str] = []
+        self._objects_lower: List[str] = []  # all_org_objects lowercased, same order
+        self._last_term = ""  # previous search term and its matches, for narrowing as the user types
+        self._last_matches: List[str] = []
+        self._last_matches_lower: List[str] = []
+        self._available_view: List[str] = []  # what the available listbox currently shows, by index
+        self._visible_index: Dict[str, int] = {}  # object name -> row in the available listbox
+        self._populated_count = 0      # rows of _available_view already inserted into the listbox
+        self._populate_generation = 0  # bumped per populate so stale chunk callbacks bail out
         self.selected_objects: Set[str] = set()
-        self.export_thread: Optional[threading.Thread] = None
-        self.message_queue = queue.Queue()
+        self._selected_sorted: List[str] = []  # selected_objects kept in display order (bisect-maintained)
+        self._loop = asyncio.new_event_loop()  # stepped from the Tk mainloop while tasks are pending
+        self._loop_ticking = False
+        self.export_task: Optional[asyncio.Task] = None
+        self.message_queue = collections.deque()  # append/popleft are atomic; single consumer (Tk thread)
+        self._poll_interval = 20  # ms; shrinks while messages flow, backs off when idle
+        self._stdout_pending = False  # console lines written but not yet flushed
         self.is_exporting = False
         
         self.grid_rowconfigure(0, weight=1)
         self.grid_columnconfigure(0, weight=1)
         
         self.login_frame = ctk.CTkFrame(self)
-        self.export_frame = ctk.CTkFrame(self)
-        
         self.login_frame.grid(row=0, column=0, sticky="nsew", padx=20, pady=20)
-        self.export_frame.grid(row=0, column=0, sticky="nsew", padx=20, pady=20)
-        
         self._setup_login_frame()
-        self._setup_export_frame()
         
-        self.export_frame.grid_forget()
+        # Export frame is built on the first successful login
+        self.export_frame: Optional[ctk.CTkFrame] = None
+        self._export_frame_built = False
+        self._early_status_lines: List[str] = []  # textbox lines from the login attempt, replayed once the frame exists
         
         # Start message queue processor
         self._process_message_queue()
 
     def _process_message_queue(self):
         """Process messages from background thread safely"""
+        processed = False
+        status_batch: List[Msg] = []
         try:
-            while True:
-                msg_type, data = self.message_queue.get_nowait()
+            # Drain only what is queued right now; later appends wait for the next tick.
+            # Bounding by len() avoids raising IndexError on every poll.
+            popleft = self.message_queue.popleft
+            pending = len(self.message_queue)
+            for _ in range(pending):
+                msg = popleft()
+                processed = True
                 
-                if msg_type == "status":
-                    message, verbose = data
-                    self._update_status_internal(message, verbose)
-                elif msg_type == "export_complete":
+                msg_type, data = msg
+                if msg_type == "status" or msg_type == "verbose":
+                    status_batch.append(msg)
+                    continue
+                
+                # Render pending status lines before completion/error handlers add their own
+                if status_batch:
+                    self._render_status_batch(status_batch)
+                    status_batch = []
+                
+                if msg_type == "export_complete":
                     output_path, stats, runtime = data
                     self._handle_export_complete(output_path, stats, runtime)
                 elif msg_type == "export_error":
                     error_msg = data
                     self._handle_export_error(error_msg)
                     
-        except queue.Empty:
-            pass
         finally:
-            # Schedule next check
-            self.after(100, self._process_message_queue)
+            # Reschedule before rendering so an error while rendering can't stop the pump for good
+            # Poll fast while busy, back off exponentially while idle
+            if processed:
+                self._poll_interval = 10
+            else:
+                self._poll_interval = min(self._poll_interval * 2, 250)
+            self.after(self._poll_interval, self._process_message_queue)
+            if status_batch:
+                self._render_status_batch(status_batch)
+            if self._stdout_pending:
+                self._stdout_pending = False
+                sys.stdout.flush()
+
+    def _run_async(self, coro) -> asyncio.Task:
+        """Schedules a coroutine on the GUI's asyncio loop and starts stepping the loop"""
+        task = self._loop.create_task(coro)
+        if not self._loop_ticking:
+            self._loop_ticking = True
+            self.after(0, self._tick_asyncio)
+        return task
+
+    def _tick_asyncio(self):
+        """Runs one asyncio loop iteration inside the Tk mainloop; stops ticking once no tasks remain"""
+        if not self._loop.is_running():  # a modal dialog may re-enter the Tk loop mid-step
+            self._loop.call_soon(self._loop.stop)
+            self._loop.run_forever()
+        if asyncio.all_tasks(self._loop):
+            self.after(10, self._tick_asyncio)
+        else:
+            self._loop_ticking = False
+
+    async def _in_daemon_thread(self, func, *args):
+        """Awaits func(*args) run on a daemon thread. Unlike run_in_executor's pool threads,
+        daemon threads don't keep the process alive when the window is closed mid-call."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        
+        def settle(setter, value):
+            if not future.done():  # the awaiting task may have been cancelled meanwhile
+                setter(value)
+        
+        def worker():
+            try:
+                result = func(*args)
+            except BaseException as e:
+                outcome = (future.set_exception, e)
+            else:
+                outcome = (future.set_result, result)
+            try:
+                loop.call_soon_threadsafe(settle, *outcome)
+            except RuntimeError:
+                pass  # loop already closed by on_closing
+        
+        threading.Thread(target=worker, daemon=True).start()
+        return await future
 
     # ==================================
     # Screen 1: Login & Authentication
@@ -479,10 +582,10 @@ class PicklistExportGUI(ctk.CTk):
         login_frame = self.login_frame
         login_frame.columnconfigure(1, weight=1)
         
-        ctk.CTkLabel(login_frame, text="Salesforce Login", font=ctk.CTkFont(size=30, weight="bold")).grid(row=0, column=0, columnspan=2, pady=(50, 40))
+        ctk.CTkLabel(login_frame, text="Salesforce Login", font=self._font_title).grid(row=0, column=0, columnspan=2, pady=(50, 40))
 
         def create_input_row(parent, row, label_text, password_mode=False):
-            ctk.CTkLabel(parent, text=label_text, anchor="w", font=ctk.CTkFont(size=14)).grid(row=row, column=0, padx=10, pady=15, sticky="w")
+            ctk.CTkLabel(parent, text=label_text, anchor="w", font=self._font_label).grid(row=row, column=0, padx=10, pady=15, sticky="w")
             entry = ctk.CTkEntry(parent, width=350, show="*" if password_mode else "")
             entry.grid(row=row, column=1, padx=10, pady=15, sticky="ew")
             return entry
@@ -491,7 +594,7 @@ class PicklistExportGUI(ctk.CTk):
         self.password_entry = create_input_row(login_frame, 2, "Password:", password_mode=True)
         self.token_entry = create_input_row(login_frame, 3, "Security Token:", password_mode=True)
 
-        ctk.CTkLabel(login_frame, text="Org Type:", anchor="w", font=ctk.CTkFont(size=14)).grid(row=4, column=0, padx=10, pady=15, sticky="w")
+        ctk.CTkLabel(login_frame, text="Org Type:", anchor="w", font=self._font_label).grid(row=4, column=0, padx=10, pady=15, sticky="w")
         self.org_type_var = ctk.StringVar(value="Production")
         radio_prod = ctk.CTkRadioButton(login_frame, text="Production", variable=self.org_type_var, value="Production")
         radio_test = ctk.CTkRadioButton(login_frame, text="Sandbox/Test", variable=self.org_type_var, value="Sandbox")
@@ -499,11 +602,11 @@ class PicklistExportGUI(ctk.CTk):
         radio_prod.grid(row=4, column=1, padx=(10, 5), pady=15, sticky="w")
         radio_test.grid(row=4, column=1, padx=(140, 10), pady=15, sticky="w")
         
-        self.login_button = ctk.CTkButton(login_frame, text="Login to Salesforce", command=self.login_action, height=50, font=ctk.CTkFont(size=16, weight="bold"))
+        self.login_button = ctk.CTkButton(login_frame, text="Login to Salesforce", command=self.login_action, height=50, font=self._font_h2)
         self.login_button.grid(row=5, column=0, columnspan=2, pady=50, sticky="ew", padx=10)
 
     def login_action(self):
-        """Login with threading to prevent UI freeze"""
+        """Login on the asyncio loop to prevent UI freeze"""
         username = self.username_entry.get().strip()
         password = self.password_entry.get().strip()
         token = self.token_entry.get().strip()
@@ -514,26 +617,24 @@ class PicklistExportGUI(ctk.CTk):
             return
 
         self.login_button.configure(state="disabled", text="Connecting...")
-        
-        def login_worker():
-            try:
-                exporter = PicklistExporter(
-                    username=username, 
-                    password=password, 
-                    security_token=token, 
-                    domain=domain,
-                    status_callback=self.queue_status_update
-                )
-                
-                # Success - update UI in main thread
-                self.after(0, lambda: self._handle_login_success(exporter))
-                
-            except Exception as e:
-                # Error - update UI in main thread
-                self.after(0, lambda: self._handle_login_error(str(e)))
-        
-        # Start login in background thread
-        threading.Thread(target=login_worker, daemon=True).start()
+        self._early_status_lines.clear()  # keep only this attempt's connection log
+        self._run_async(self._login_async(username, password, token, domain))
+
+    async def _login_async(self, username: str, password: str, token: str, domain: str):
+        """Connects to Salesforce on a daemon thread and hands the result back to Tk"""
+        try:
+            exporter = await self._in_daemon_thread(lambda: PicklistExporter(
+                username=username, 
+                password=password, 
+                security_token=token, 
+                domain=domain,
+                status_callback=self.queue_status_update
+            ))
+        except Exception as e:
+            # Handlers open modal dialogs, so run them from Tk rather than inside the loop step
+            self.after(0, self._handle_login_error, str(e))
+            return
+        self.after(0, self._handle_login_success, exporter)
 
     def _handle_login_success(self, exporter):
         """Handle successful login (called in main thread)"""
@@ -541,6 +642,16 @@ class PicklistExportGUI(ctk.CTk):
         messagebox.showinfo("Success", "Successfully connected to Salesforce!")
         
         self.all_org_objects = self.sf_exporter.get_all_objects()
+        self._objects_lower = [s.lower() for s in self.all_org_objects]
+        self._last_term = ""
+        
+        if not self._export_frame_built:
+            self.export_frame = ctk.CTkFrame(self)
+            self._setup_export_frame()
+            self._export_frame_built = True
+            if self._early_status_lines:
+                self.status_textbox.insert("end", "\n" + "\n".join(self._early_status_lines))
+                self._early_status_lines.clear()
         
         # Switch to Export Frame
         self.login_frame.grid_forget()
@@ -556,21 +667,31 @@ class PicklistExportGUI(ctk.CTk):
 
     def queue_status_update(self, message: str, verbose: bool = False):
         """Queue status update from background thread"""
-        self.message_queue.put(("status", (message, verbose)))
+        self.message_queue.append(Msg("verbose" if verbose else "status", message))
 
     def _update_status_internal(self, message: str, verbose: bool):
         """Update status in main thread"""
+        self._render_status_batch([Msg("verbose" if verbose else "status", message)])
+
+    def _render_status_batch(self, batch: List[Msg]):
+        """Appends a batch of status/verbose messages with a single textbox update"""
         timestamp = datetime.now().strftime("[%H:%M:%S]")
-        display_message = f"{timestamp} {message}"
+        display_messages = [f"{timestamp} {msg.payload}" for msg in batch]
         
-        self.status_textbox.configure(state="normal")
-        self.status_textbox.insert("end", "\n" + display_message)
-        self.status_textbox.see("end")
-        
-        if not verbose:
-            print(display_message)
+        # Before the first login there is no status textbox yet; hold the lines (with their
+        # original timestamps) until _handle_login_success builds it
+        if self._export_frame_built:
+            self.status_textbox.insert("end", "\n" + "\n".join(display_messages))
+            self.status_textbox.see("end")
+        else:
+            self._early_status_lines.extend(display_messages)
         
-        self.status_textbox.configure(state="disabled")
+        console_messages = [line for line, msg in zip(display_messages, batch) if msg.kind == "status"]
+        # sys.stdout is None under pythonw / windowed builds, where print() would have been a no-op
+        if console_messages and sys.stdout is not None:
+            # Flushed once per queue tick in _process_message_queue
+            sys.stdout.write("\n".join(console_messages) + "\n")
+            self._stdout_pending = True
 
     # ==================================
     # Screen 2: Object Selection & Export
@@ -584,7 +705,7 @@ class PicklistExportGUI(ctk.CTk):
         header_frame = ctk.CTkFrame(export_frame, fg_color="transparent")
         header_frame.grid(row=0, column=0, pady=(5, 5), sticky="ew")
         header_frame.columnconfigure(0, weight=1)
-        ctk.CTkLabel(header_frame, text="Object Selection & Export", font=ctk.CTkFont(size=24, weight="bold")).grid(row=0, column=0, sticky="w")
+        ctk.CTkLabel(header_frame, text="Object Selection & Export", font=self._font_header).grid(row=0, column=0, sticky="w")
         
         self.logout_button = ctk.CTkButton(header_frame, text="Logout", command=self.logout_action, width=100, fg_color="#CC3333")
         self.logout_button.grid(row=0, column=1, sticky="e", padx=10)
@@ -602,7 +723,7 @@ class PicklistExportGUI(ctk.CTk):
         available_frame.grid_rowconfigure(2, weight=1)
         available_frame.grid_columnconfigure(0, weight=1)
         
-        ctk.CTkLabel(available_frame, text="Available Objects", font=ctk.CTkFont(size=16, weight="bold")).grid(row=0, column=0, pady=3)
+        ctk.CTkLabel(available_frame, text="Available Objects", font=self._font_h2).grid(row=0, column=0, pady=3)
         
         self.search_entry = ctk.CTkEntry(available_frame, placeholder_text="Search...", height=30)
         self.search_entry.grid(row=1, column=0, padx=8, pady=3, sticky="ew")
@@ -620,7 +741,7 @@ class PicklistExportGUI(ctk.CTk):
         action_frame = ctk.CTkFrame(selection_frame, fg_color="transparent")
         action_frame.grid(row=0, column=1, padx=3, pady=5, sticky="n")
         
-        ctk.CTkLabel(action_frame, text="Actions", font=ctk.CTkFont(size=13, weight="bold")).pack(pady=3)
+        ctk.CTkLabel(action_frame, text="Actions", font=self._font_h3).pack(pady=3)
         
         ctk.CTkButton(action_frame, text=">> Add >>", command=self.add_selected_to_export, height=30, width=100).pack(pady=3, padx=3, fill="x")
         ctk.CTkButton(action_frame, text="<< Remove <<", command=self.remove_selected_from_export, height=30, width=100).pack(pady=3, padx=3, fill="x")
@@ -638,9 +759,9 @@ class PicklistExportGUI(ctk.CTk):
         header_container.grid(row=0, column=0, pady=3, sticky="ew")
         header_container.columnconfigure(0, weight=1)
         
-        ctk.CTkLabel(header_container, text="Selected for Export", font=ctk.CTkFont(size=16, weight="bold")).grid(row=0, column=0, sticky="w", padx=8)
+        ctk.CTkLabel(header_container, text="Selected for Export", font=self._font_h2).grid(row=0, column=0, sticky="w", padx=8)
         
-        self.selected_count_label = ctk.CTkLabel(header_container, text="(0)", font=ctk.CTkFont(size=13))
+        self.selected_count_label = ctk.CTkLabel(header_container, text="(0)", font=self._font_small)
         self.selected_count_label.grid(row=0, column=1, sticky="e", padx=8)
         
         self.selected_listbox = tk.Listbox(selected_frame, selectmode="extended", height=12, exportselection=False,
@@ -649,13 +770,14 @@ class PicklistExportGUI(ctk.CTk):
         self.selected_listbox.grid(row=1, column=0, padx=8, pady=(0, 8), sticky="nsew")
 
         # Status textbox - FIXED HEIGHT
-        status_label = ctk.CTkLabel(export_frame, text="Export Status:", font=ctk.CTkFont(size=14, weight="bold"), anchor="w")
+        status_label = ctk.CTkLabel(export_frame, text="Export Status:", font=self._font_label_bold, anchor="w")
         status_label.grid(row=2, column=0, padx=20, pady=(5, 0), sticky="w")
         
         self.status_textbox = ctk.CTkTextbox(export_frame, height=120)
         self.status_textbox.grid(row=3, column=0, padx=20, pady=(0, 5), sticky="ew")
         self.status_textbox.insert("end", "Status: Ready to select objects and export.")
-        self.status_textbox.configure(state="disabled")
+        # Read-only via key binding so status updates don't toggle the widget state
+        self.status_textbox.bind("<Key>", self._status_key)
 
         # Export button frame with cancel button
         button_frame = ctk.CTkFrame(export_frame, fg_color="transparent")
@@ -663,14 +785,27 @@ class PicklistExportGUI(ctk.CTk):
         button_frame.columnconfigure(0, weight=1)
         
         self.export_button = ctk.CTkButton(button_frame, text="Export Picklist Data", command=self.export_action, 
-                                          height=45, fg_color="green", font=ctk.CTkFont(size=15, weight="bold"))
+                                          height=45, fg_color="green", font=self._font_button)
         self.export_button.grid(row=0, column=0, sticky="ew", padx=(0, 10))
         
         self.cancel_button = ctk.CTkButton(button_frame, text="Cancel Export", command=self.cancel_export_action,
-                                          height=45, fg_color="#CC3333", font=ctk.CTkFont(size=15, weight="bold"), width=150)
+                                          height=45, fg_color="#CC3333", font=self._font_button, width=150)
         self.cancel_button.grid(row=0, column=1, sticky="e")
         self.cancel_button.grid_remove()  # Hide initially
     
+    def _status_key(self, event):
+        """Blocks keys that would edit the status log; copy, select-all and navigation still work"""
+        if event.state & (0x0004 | 0x0008):  # Control, or Command on macOS
+            key = event.keysym.lower()
+            if key == "a":
+                self.status_textbox.tag_add("sel", "1.0", "end")
+                return "break"
+            if key in ("c", "insert", "slash"):
+                return None
+        if event.keysym in _STATUS_NAVIGATION_KEYS:
+            return None
+        return "break"
+
     def _debounced_search(self, event):
         """Debounce search to prevent excessive filtering"""
         if self._search_after_id:
@@ -684,40 +819,68 @@ class PicklistExportGUI(ctk.CTk):
     # --- Object List Management Methods ---
 
     def populate_available_objects(self, objects: List[str]):
-        """Populates the Left ListBox - optimized with batch updates"""
+        """Populates the Left ListBox - first chunk now, the rest from idle callbacks"""
         self.available_listbox.delete(0, END)
+        self._available_view = objects
+        self._visible_index = {obj: idx for idx, obj in enumerate(objects)}
+        self._populated_count = 0
+        self._populate_generation += 1
+        self._populate_available_chunk(objects, self._populate_generation)
+
+    def _populate_available_chunk(self, objects: List[str], generation: int):
+        """Inserts the next POPULATE_CHUNK_SIZE rows so large orgs don't block the GUI"""
+        if generation != self._populate_generation:
+            return  # superseded by a newer populate
         
-        # Batch insert for better performance
-        for obj in objects:
-            self.available_listbox.insert(END, obj)
+        listbox = self.available_listbox
+        start = self._populated_count
+        chunk = objects[start:start + POPULATE_CHUNK_SIZE]
+        
+        # Single varargs insert: one Tcl call for the whole chunk
+        if chunk:
+            listbox.insert(END, *chunk)
         
-        # Color selected items in a separate pass
-        for idx, obj in enumerate(objects):
-            if obj in self.selected_objects:
-                self.available_listbox.itemconfig(idx, {'fg': '#87CEEB'})
+        # Color selected items in a separate pass (lookups hoisted out of the loop)
+        itemconfig = listbox.itemconfig
+        highlight = {'fg': '#87CEEB'}
+        selected = self.selected_objects
+        for idx, obj in enumerate(chunk, start):
+            if obj in selected:
+                itemconfig(idx, highlight)
+        
+        self._populated_count = start + len(chunk)
+        if self._populated_count < len(objects):
+            self.after_idle(self._populate_available_chunk, objects, generation)
 
     def populate_selected_objects(self):
         """Populates the Right ListBox - optimized"""
         self.selected_listbox.delete(0, END)
-        sorted_selection = sorted(list(self.selected_objects))
-        
-        for obj in sorted_selection:
-            self.selected_listbox.insert(END, obj)
+        if self._selected_sorted:
+            self.selected_listbox.insert(END, *self._selected_sorted)
         
         # Update count label
         self.selected_count_label.configure(text=f"({len(self.selected_objects)})")
 
     def filter_available_objects(self):
-        """Filters the Available ListBox - optimized"""
+        """Filters the Available ListBox - skips the repopulate when the visible set is unchanged"""
         search_term = self.search_entry.get().lower()
         
         if not search_term:
             # No filter - show all
             filtered_objects = self.all_org_objects
         else:
-            # Filter with list comprehension (faster than loop)
-            filtered_objects = [obj for obj in self.all_org_objects if search_term in obj.lower()]
+            if self._last_term and search_term.startswith(self._last_term):
+                # Extending the previous term can only narrow its matches
+                names, names_lower = self._last_matches, self._last_matches_lower
+            else:
+                # Match against the names lowercased once at login
+                names, names_lower = self.all_org_objects, self._objects_lower
+            filtered_objects, self._last_matches_lower = filter_contains(names, names_lower, search_term)
+            self._last_matches = filtered_objects
+        self._last_term = search_term
         
+        if filtered_objects == self._available_view:
+            return
         self.populate_available_objects(filtered_objects)
     
     def add_selected_to_export(self):
@@ -729,17 +892,21 @@ class PicklistExportGUI(ctk.CTk):
             return
 
         # Batch add to set
-        objects_to_add = [self.available_listbox.get(i) for i in selected_indices]
+        objects_to_add = [self._available_view[i] for i in selected_indices]
         added_count = 0
         
+        # Insert each new name at its sorted position in both the list and the right pane
         for obj_name in objects_to_add:
             if obj_name not in self.selected_objects:
                 self.selected_objects.add(obj_name)
+                pos = bisect.bisect_left(self._selected_sorted, obj_name)
+                self._selected_sorted.insert(pos, obj_name)
+                self.selected_listbox.insert(pos, obj_name)
                 added_count += 1
         
         if added_count > 0:
-            self.populate_selected_objects()
-            self.filter_available_objects()
+            self.selected_count_label.configure(text=f"({len(self.selected_objects)})")
+            self._recolor_available(objects_to_add, '#87CEEB')
             self.update_status(f"Added {added_count} object(s) to export list.")
 
     def remove_selected_from_export(self):
@@ -751,16 +918,31 @@ class PicklistExportGUI(ctk.CTk):
             return
 
         # Batch remove from set
-        objects_to_remove = [self.selected_listbox.get(i) for i in selected_indices]
+        objects_to_remove = [self._selected_sorted[i] for i in selected_indices]
         
         for obj_name in objects_to_remove:
             self.selected_objects.discard(obj_name)
+            pos = bisect.bisect_left(self._selected_sorted, obj_name)
+            self._selected_sorted.pop(pos)
+            self.selected_listbox.delete(pos)
         
         if objects_to_remove:
-            self.populate_selected_objects()
-            self.filter_available_objects()
+            self.selected_count_label.configure(text=f"({len(self.selected_objects)})")
+            self._recolor_available(objects_to_remove, 'white')
             self.update_status(f"Removed {len(objects_to_remove)} object(s) from export list.")
 
+    def _recolor_available(self, objects: List[str], color: str):
+        """Recolors only the given rows of the Available ListBox instead of rebuilding it"""
+        itemconfig = self.available_listbox.itemconfig
+        option = {'fg': color}
+        index_of = self._visible_index.get
+        populated = self._populated_count
+        for obj in objects:
+            idx = index_of(obj)
+            # Rows not inserted yet pick up their color when their chunk is inserted
+            if idx is not None and idx < populated:
+                itemconfig(idx, option)
+
     def select_all_available(self):
         """Selects all objects currently visible"""
         self.available_listbox.select_set(0, END)
@@ -781,7 +963,12 @@ class PicklistExportGUI(ctk.CTk):
         if confirm:
             self.sf_exporter = None
             self.selected_objects.clear()
-            self.all_org_objects.clear()
+            self._selected_sorted.clear()
+            self.all_org_objects = []
+            self._objects_lower = []
+            self._last_term = ""
+            self._available_view = []
+            self._visible_index = {}
             
             # Reset login button
             self.login_button.configure(state="normal", text="Login to Salesforce")
@@ -798,7 +985,7 @@ class PicklistExportGUI(ctk.CTk):
             self.login_frame.grid(row=0, column=0, sticky="nsew", padx=20, pady=20)
 
     def export_action(self):
-        """Export with threading to prevent UI freeze"""
+        """Export on the asyncio loop to prevent UI freeze"""
         if not self.sf_exporter:
             messagebox.showerror("Error", "Not logged in. Please log in first.")
             return
@@ -807,7 +994,7 @@ class PicklistExportGUI(ctk.CTk):
             messagebox.showwarning("Export In Progress", "An export is already running. Please wait.")
             return
 
-        selected_objects_list = sorted(list(self.selected_objects))
+        selected_objects_list = list(self._selected_sorted)  # copy: the worker iterates it while the UI stays live
 
         if not selected_objects_list:
             messagebox.showwarning("Warning", "The 'Selected for Export' list is empty. Please add objects.")
@@ -831,31 +1018,26 @@ class PicklistExportGUI(ctk.CTk):
         
         self.update_status(f"Starting export for {len(selected_objects_list)} objects to {output_file_path}...")
         
-        # Start export in background thread
-        def export_worker():
-            start_time = time.time()
-            output_path = None
-            stats = None
-            
-            try:
-                output_path, stats = self.sf_exporter.export_picklists(
-                    selected_objects_list, 
-                    output_file_path
-                )
-                
-                end_time = time.time()
-                runtime_seconds = end_time - start_time
-                runtime_formatted = format_runtime(runtime_seconds)
-                
-                # Queue completion message
-                self.message_queue.put(("export_complete", (output_path, stats, runtime_formatted)))
-                
-            except Exception as e:
-                # Queue error message
-                self.message_queue.put(("export_error", str(e)))
+        self.export_task = self._run_async(self._export_async(selected_objects_list, output_file_path))
+
+    async def _export_async(self, selected_objects_list: List[str], output_file_path: str):
+        """Runs the blocking export on a daemon thread"""
+        start_time = time.time()
         
-        self.export_thread = threading.Thread(target=export_worker, daemon=True)
-        self.export_thread.start()
+        try:
+            output_path, stats = await self._in_daemon_thread(
+                self.sf_exporter.export_picklists, selected_objects_list, output_file_path
+            )
+            
+            end_time = time.time()
+            runtime_seconds = end_time - start_time
+            runtime_formatted = format_runtime(runtime_seconds)
+            
+            # Queued behind the export's status messages so they render first
+            self.message_queue.append(Msg("export_complete", (output_path, stats, runtime_formatted)))
+            
+        except Exception as e:
+            self.message_queue.append(Msg("export_error", str(e)))
 
     def cancel_export_action(self):
         """Cancel ongoing export"""
@@ -907,6 +1089,13 @@ class PicklistExportGUI(ctk.CTk):
             if self.sf_exporter:
                 self.sf_exporter.cancel_export()
         
+        # Cancel whatever is still awaiting a worker thread, let it unwind, then close the loop
+        if not self._loop.is_running():
+            for task in asyncio.all_tasks(self._loop):
+                task.cancel()
+            self._loop.call_soon(self._loop.stop)
+            self._loop.run_forever()
+            self._loop.close()
         self.destroy()
 
 
@@ -535,7 +535,7 @@ class PicklistExportGUI(ctk.CTk):
     def populate_selected_objects(self):
         """Populates the Right ListBox from the internal selected_objects set (always sorted)."""
         self.selected_listbox.delete(0, END)
-        for obj in sorted(list(self.selected_objects)):
+        for obj in sorted(self.selected_objects):
             self.selected_listbox.insert(END, obj)
 
     def filter_available_objects(self, event):
@@ -622,7 +622,7 @@ class PicklistExportGUI(ctk.CTk):
             messagebox.showerror("Error", "Not logged in. Please log in first.")
             return
 
-        selected_objects_list = sorted(list(self.selected_objects))
+        selected_objects_list = sorted(self.selected_objects)
 
         if not selected_objects_list:
             messagebox.showwarning("Warning", "The 'Selected for Task' list is empty. Please add objects.")
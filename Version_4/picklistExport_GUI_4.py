@@ -5,22 +5,41 @@ Prerequisites (Installation)
 Single Command Installation:
    pip install simple-salesforce openpyxl requests customtkinter
 
+Optional (faster parsing of large Tooling API responses):
+   pip install orjson
+
 '''
 import os
+import re
 import sys
+import json
+import queue
 import time
+import bisect
+import hashlib
 import requests
+from requests.adapters import HTTPAdapter
+from urllib.parse import quote
 import tkinter as tk 
 import threading
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from itertools import compress, repeat
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Tuple, Set
+from typing import List, Dict, Optional, Tuple, Set, NamedTuple
 
 # Third-party libraries
 from simple_salesforce import Salesforce
 from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Font, PatternFill, Alignment
 from openpyxl.utils import get_column_letter
 
+# Optional: orjson parses straight from bytes and is several times faster than the stdlib
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
 # GUI Library
 import customtkinter as ctk
 from tkinter import messagebox, filedialog, END, ttk
@@ -35,24 +54,60 @@ ctk.set_default_color_theme("blue")
 
 API_VERSION = '65.0'
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+LOG_BATCH_SIZE = 100        # Flush buffered log lines after this many messages...
+LOG_FLUSH_INTERVAL = 0.25   # ...or after this many seconds, whichever comes first
+MAX_CONCURRENT_OBJECTS = 32  # Objects processed in parallel (bounded by Salesforce API limits)
+MAX_CONCURRENT_REQUESTS = 16  # In-flight REST/Tooling calls across all workers
+MAX_RETRIES = 5              # Attempts per call on dropped connections / throttling responses
+RETRY_BACKOFF = 0.5          # Seconds before the first retry, doubled on each attempt
+RETRY_STATUS_CODES = frozenset((429, 502, 503, 504))
+ENTITYDEF_BATCH_SIZE = 200   # Object names per EntityDefinition prefetch query
+COMPOSITE_BATCH_SIZE = 25    # Salesforce's limit on subrequests per Composite Batch call
+DESCRIBE_PREFETCH_WINDOW = 100  # Objects whose describes are prefetched ahead of the workers at a time
+SEARCH_DEBOUNCE_MS = 150     # Search runs once typing pauses for this long
+SELECTED_OBJECT_FG = '#87CEEB'  # Available-list color for objects already selected for export
+AVAILABLE_WINDOW_ROWS = 200  # Rows the Available ListBox holds at once; scrolling slides this window
+EVENT_SHIFT_MASK = 0x0001    # Tk event.state bits for the click modifiers
+EVENT_CONTROL_MASK = 0x0004
+STATUS_FLUSH_MS = 50         # Status lines are written to the textbox at most this often
+STATUS_MAX_LINES = 2000      # Older status lines are dropped beyond this many
+PROGRESS_POLL_MS = 50        # Export progress posted by the worker is applied at most this often
+OBJECT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".picklistexporter", "cache")
+OBJECT_CACHE_TTL = 24 * 3600  # Seconds a cached org object list is used before a blocking refetch
+
+# Salesforce API names are plain identifiers; anything else can only fail (or inject) in SOQL
+_SAFE_IDENTIFIER = re.compile(r'[A-Za-z_][A-Za-z0-9_]*').fullmatch
+
+
+def _soql_escape(value: str) -> str:
+    """Escapes a value for use inside a single-quoted SOQL string literal"""
+    return value.replace("\\", "\\\\").replace("'", "\\'")
+
+
+def _soql_in_list(values: List[str]) -> str:
+    """Formats values as the body of a SOQL IN (...) clause"""
+    return ", ".join(f"'{_soql_escape(value)}'" for value in values)
+
+
+# Status column values, shared by every exported row
+_ACTIVE = sys.intern('Active')
+_INACTIVE = sys.intern('Inactive')
 
 # ===========================================
 # HELPER CLASSES 
 # ===========================================
 
-class FieldInfo:
+class FieldInfo(NamedTuple):
     """Represents picklist field metadata"""
-    def __init__(self, api_name: str, label: str):
-        self.api_name = api_name
-        self.label = label
+    api_name: str
+    label: str
 
 
-class PicklistValueDetail:
+class PicklistValueDetail(NamedTuple):
     """Represents a single picklist value"""
-    def __init__(self, label: str, value: str, is_active: bool = True):
-        self.label = label
-        self.value = value
-        self.is_active = is_active
+    label: str
+    value: str
+    is_active: bool = True
 
 
 class ProcessingResult:
@@ -60,24 +115,73 @@ class ProcessingResult:
     def __init__(self):
         self.values_processed = 0
         self.inactive_values = 0
-        self.rows: List[List[str]] = []
+        # Export columns (Object, Field Label, Field API, Value Label, Value API, Status), one list each
+        self.columns: Tuple[List[str], ...] = ([], [], [], [], [], [])
+        self.widths: List[int] = [0] * 6  # Longest value per column, measured while the columns are built
         self.picklist_fields_count = 0
         self.object_exists = True
         self.error_message = None
 
 
+class ExportStats:
+    """Accumulates export statistics across objects"""
+    __slots__ = (
+        'total_objects', 'successful_objects', 'failed_objects', 'objects_not_found',
+        'objects_with_zero_picklists', 'objects_with_picklists', 'total_picklist_fields', 'total_values',
+        'total_active_values', 'total_inactive_values', 'failed_object_details',
+        'objects_without_picklists', 'objects_not_found_list'
+    )
+
+    def __init__(self, total_objects: int):
+        self.total_objects = total_objects
+        self.successful_objects = 0
+        self.failed_objects = 0
+        self.objects_not_found = 0
+        self.objects_with_zero_picklists = 0
+        self.objects_with_picklists = 0
+        self.total_picklist_fields = 0
+        self.total_values = 0
+        self.total_active_values = 0
+        self.total_inactive_values = 0
+        self.failed_object_details: List[Dict] = []
+        self.objects_without_picklists: List[str] = []
+        self.objects_not_found_list: List[str] = []
+
+    def to_dict(self) -> Dict:
+        """Converts the accumulated statistics to the dict consumed by the GUI and console report"""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
 # ===========================================
 # MAIN EXPORT CLASS 
 # ===========================================
 
 class PicklistExporter:
     """Main exporter class with enhanced statistics"""
+
+    # SOQL templates, formatted with str.format() per query
+    _Q_ENTITYDEF = "SELECT Id FROM EntityDefinition WHERE QualifiedApiName = '{o}'"
+    _Q_ENTITYDEF_BULK = "SELECT Id, QualifiedApiName FROM EntityDefinition WHERE QualifiedApiName IN ({o})"
+    _Q_FIELDDEF = "SELECT Metadata FROM FieldDefinition WHERE EntityDefinition.QualifiedApiName = '{o}' AND QualifiedApiName = '{f}'"
+    _Q_CUSTOMFIELD = "SELECT Metadata FROM CustomField WHERE TableEnumOrId = '{t}' AND DeveloperName = '{d}'"
     
-    def __init__(self, username: str, password: str, security_token: str, domain: str = 'login', status_callback=None):
-        """Initialize Salesforce connection"""
+    def __init__(self, username: str, password: str, security_token: str, domain: str = 'login', status_callback=None,
+                 fetch_objects: bool = True):
+        """Initialize Salesforce connection (fetch_objects=False defers the org object list to refresh_all_objects)"""
         self.status_callback = status_callback
         self.all_org_objects: List[str] = []
-        
+        self._org_object_set: Set[str] = set()
+        self._log_buf: List[str] = []
+        self._log_lock = threading.Lock()
+        self._log_emit_lock = threading.Lock()  # Orders callbacks without holding _log_lock during them
+        self._log_timer: Optional[threading.Timer] = None
+        self._request_slots = threading.BoundedSemaphore(MAX_CONCURRENT_REQUESTS)
+        self._describe_cache: Dict[str, Dict] = {}  # Describes of objects prefetched or in progress
+        self._field_index_cache: Dict[str, Dict[str, Dict]] = {}
+        self._entity_def_cache: Dict[str, Optional[str]] = {}
+        if not self.status_callback:
+            self._log_status = lambda *_: None
+
         if self.status_callback:
             self.status_callback("Initializing Salesforce Connection...")
             
@@ -89,18 +193,31 @@ class PicklistExporter:
                 domain=domain
             )
             self.base_url = f"https://{self.sf.sf_instance}"
+            self._tooling_url = f"{self.base_url}/services/data/v{API_VERSION}/tooling/query/"
+            self._describe_url_fmt = f"{self.base_url}/services/data/v{API_VERSION}/sobjects/{{}}/describe"
+            self._composite_batch_url = f"{self.base_url}/services/data/v{API_VERSION}/composite/batch"
+            self._tooling_composite_batch_url = f"{self.base_url}/services/data/v{API_VERSION}/tooling/composite/batch"
             self.session_id = self.sf.session_id
             self.headers = {
                 'Authorization': f'Bearer {self.session_id}',
                 'Content-Type': 'application/json'
             }
+            # One keep-alive session for all REST/Tooling calls. Retries live in _request rather than in the
+            # adapter, whose backoff would sleep while the caller holds a request slot
+            self.http = requests.Session()
+            self.http.headers.update(self.headers)
+            self.http.mount("https://", HTTPAdapter(
+                pool_connections=MAX_CONCURRENT_REQUESTS, pool_maxsize=MAX_CONCURRENT_REQUESTS
+            ))
             if self.status_callback:
                 self.status_callback(f"✅ Connected to: {self.base_url}")
             
-            self._fetch_all_org_objects()
+            if fetch_objects:
+                self._fetch_all_org_objects()
 
         except Exception as e:
             if self.status_callback:
+                self._flush_log()
                 self.status_callback(f"❌ Connection failed: {str(e)}")
             raise
 
@@ -113,75 +230,184 @@ class PicklistExporter:
                 obj['name'] for obj in response['sobjects'] 
                 if obj.get('queryable', False) and not obj.get('deprecatedAndHidden', False)
             ])
+            self._org_object_set = set(self.all_org_objects)
             self._log_status(f"✅ Found {len(self.all_org_objects)} queryable objects.")
         except Exception as e:
             self._log_status(f"❌ Failed to fetch all SObjects: {str(e)}")
             self.all_org_objects = []
-            
+            self._org_object_set = set()
+        self._flush_log()
+
     def get_all_objects(self) -> List[str]:
         """Accessor for the fetched object list"""
         return self.all_org_objects
 
+    def refresh_all_objects(self) -> List[str]:
+        """Re-fetches the org object list from Salesforce and returns it"""
+        self._fetch_all_org_objects()
+        return self.all_org_objects
+
     def _log_status(self, message: str):
-        """Internal helper to send log messages back to the GUI"""
-        if self.status_callback:
-            self.status_callback(message, verbose=True) 
+        """Internal helper to buffer log messages and send them back to the GUI in batches"""
+        with self._log_lock:
+            self._log_buf.append(message)
+            if len(self._log_buf) < LOG_BATCH_SIZE:
+                if self._log_timer is None:
+                    self._log_timer = threading.Timer(LOG_FLUSH_INTERVAL, self._flush_log)
+                    self._log_timer.daemon = True
+                    self._log_timer.start()
+                return
+        self._flush_log()
+
+    def _flush_log(self):
+        """Sends all buffered log messages to the GUI as a single callback"""
+        # The emit lock is taken before the buffer is swapped so timer and worker flushes stay in order,
+        # while _log_lock is released before the callback so workers can keep logging meanwhile
+        with self._log_emit_lock:
+            with self._log_lock:
+                if self._log_timer is not None:
+                    self._log_timer.cancel()
+                    self._log_timer = None
+                if not self._log_buf:
+                    return
+                buf, self._log_buf = self._log_buf, []
+            self.status_callback('\n'.join(buf), verbose=True)
+
+    def _request(self, method: str, url: str, timeout: int, **kwargs) -> requests.Response:
+        """Sends a request over the shared session, holding one of the request slots only while it is in flight.
+        Dropped connections (e.g. RemoteDisconnected) and throttling responses are retried with exponential backoff."""
+        delay = RETRY_BACKOFF
+        for attempt in range(1, MAX_RETRIES + 1):
+            try:
+                with self._request_slots:
+                    response = self.http.request(method, url, timeout=timeout, **kwargs)
+                if response.status_code not in RETRY_STATUS_CODES or attempt == MAX_RETRIES:
+                    return response
+            except (requests.ConnectionError, requests.Timeout):
+                if attempt == MAX_RETRIES: raise
+            # Sleep outside the slot so other workers keep using it
+            time.sleep(delay)
+            delay *= 2
+
+    def _get(self, url: str, params: Optional[Dict] = None) -> requests.Response:
+        """GETs a REST/Tooling endpoint (see _request)"""
+        return self._request('GET', url, 60, params=params)
+
+    def _post(self, url: str, payload: Dict) -> requests.Response:
+        """POSTs JSON to a REST endpoint (see _request); only used for Composite Batch calls of GET subrequests, so retrying is safe"""
+        return self._request('POST', url, 120, json=payload)
 
     def export_picklists(self, object_names: List[str], output_path: str, progress_callback=None) -> Tuple[str, Dict]:
         self._log_status("=== Starting Picklist Export ===")
         self._log_status(f"Total objects to process: {len(object_names)}")
         
-        stats = {
-            'total_objects': len(object_names), 'successful_objects': 0, 'failed_objects': 0, 'objects_not_found': 0,
-            'objects_with_zero_picklists': 0, 'objects_with_picklists': 0, 'total_picklist_fields': 0, 'total_values': 0,
-            'total_active_values': 0, 'total_inactive_values': 0, 'failed_object_details': [],
-            'objects_without_picklists': [], 'objects_not_found_list': []
-        }
+        stats = ExportStats(len(object_names))
         
-        all_rows = [['Object', 'Field Label', 'Field API', 'Picklist Value Label', 'Picklist Value API', 'Status']]
+        # Per-object column lists, streamed to the sheet as-is instead of being concatenated
+        column_blocks: List[Tuple[List[str], ...]] = []
+        column_widths = [0] * 6
         
-        for i, obj_name in enumerate(object_names, 1):
-            if progress_callback:
-                progress_callback(i, len(object_names))
-            
-            self._log_status(f"[{i}/{len(object_names)}] Processing object: {obj_name}")
-            try:
-                result = self._process_object(obj_name)
-                
-                if not result.object_exists:
-                    stats['objects_not_found'] += 1
-                    stats['objects_not_found_list'].append(obj_name)
-                    stats['failed_object_details'].append({'name': obj_name, 'reason': 'Object does not exist in org'})
-                    self._log_status(f"  ⚠️  Object not found in org")
-                elif result.picklist_fields_count == 0:
-                    stats['objects_with_zero_picklists'] += 1
-                    stats['objects_without_picklists'].append(obj_name)
-                    stats['successful_objects'] += 1
-                    self._log_status(f"  ℹ️  No picklist fields found")
-                else:
-                    stats['objects_with_picklists'] += 1
-                    stats['successful_objects'] += 1
-                    stats['total_picklist_fields'] += result.picklist_fields_count
-                    all_rows.extend(result.rows)
-                    stats['total_values'] += result.values_processed
-                    stats['total_inactive_values'] += result.inactive_values
-                    stats['total_active_values'] += (result.values_processed - result.inactive_values)
-                    self._log_status(f"  ✅ Fields: {result.picklist_fields_count}, Active: {result.values_processed - result.inactive_values}, Inactive: {result.inactive_values}")
-            except Exception as e:
-                error_msg = str(e)
-                self._log_status(f"  ❌ ERROR: {error_msg}")
-                stats['failed_objects'] += 1
-                stats['failed_object_details'].append({'name': obj_name, 'reason': error_msg})
-            self._log_status("")
+        self._prefetch_entity_definition_ids(object_names)
+        results = self._process_objects_concurrently(object_names, progress_callback)
+        
+        self._log_status("=== Object Summary ===")
+        # Without a callback _log_status is a no-op; skip building its f-strings too
+        logging_enabled = self.status_callback is not None
+        # Accumulate in locals and write back to stats once after the loop
+        failed_details = stats.failed_object_details
+        not_found_list = stats.objects_not_found_list
+        without_picklists = stats.objects_without_picklists
+        with_picklists = total_fields = total_values = total_inactive = 0
+        for obj_name, result in zip(object_names, results):
+            if isinstance(result, Exception):
+                error_msg = str(result)
+                if logging_enabled: self._log_status(f"  ❌ {obj_name}: ERROR: {error_msg}")
+                failed_details.append({'name': obj_name, 'reason': error_msg})
+            elif not result.object_exists:
+                not_found_list.append(obj_name)
+                failed_details.append({'name': obj_name, 'reason': 'Object does not exist in org'})
+                if logging_enabled: self._log_status(f"  ⚠️  {obj_name}: Object not found in org")
+            elif result.picklist_fields_count == 0:
+                without_picklists.append(obj_name)
+                if logging_enabled: self._log_status(f"  ℹ️  {obj_name}: No picklist fields found")
+            else:
+                with_picklists += 1
+                total_fields += result.picklist_fields_count
+                total_values += result.values_processed
+                total_inactive += result.inactive_values
+                column_blocks.append(result.columns)
+                column_widths = list(map(max, column_widths, result.widths))
+                if logging_enabled:
+                    active_values = result.values_processed - result.inactive_values
+                    self._log_status(f"  ✅ {obj_name}: Fields: {result.picklist_fields_count}, Active: {active_values}, Inactive: {result.inactive_values}")
+        # Every not-found object also has a failure entry; the rest of the failures are exceptions
+        stats.objects_not_found = len(not_found_list)
+        stats.failed_objects = len(failed_details) - stats.objects_not_found
+        stats.objects_with_zero_picklists = len(without_picklists)
+        stats.objects_with_picklists = with_picklists
+        stats.successful_objects = with_picklists + stats.objects_with_zero_picklists
+        stats.total_picklist_fields = total_fields
+        stats.total_values = total_values
+        stats.total_inactive_values = total_inactive
+        stats.total_active_values = total_values - total_inactive
+        self._log_status("")
         
         self._log_status("=== Creating Excel File ===")
-        final_output_path = self._create_excel_file(all_rows, output_path)
-        return final_output_path, stats
+        final_output_path = self._create_excel_file(column_blocks, column_widths, output_path)
+        self._flush_log()
+        return final_output_path, stats.to_dict()
+    
+    def _process_objects_concurrently(self, object_names: List[str], progress_callback=None) -> List:
+        """Fans _process_object out over a bounded thread pool; results (or exceptions) keep input order.
+        Describes are prefetched a window of DESCRIBE_PREFETCH_WINDOW objects at a time. A window is submitted
+        as soon as its prefetch is done and no more than one window of objects is still queued, so the pool
+        never waits on a window boundary, while each describe is dropped once its object is done and only a
+        few windows of describes are held in memory instead of one per selected object."""
+        total = len(object_names)
+        results: List = [None] * total
+        windows = [range(start, min(start + DESCRIBE_PREFETCH_WINDOW, total)) for start in range(0, total, DESCRIBE_PREFETCH_WINDOW)]
+        next_window = 0
+        futures: Dict = {}
+        completed = 0
+        
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_OBJECTS) as executor, ThreadPoolExecutor(max_workers=1) as prefetcher:
+            def start_prefetch(number):
+                window = windows[number]
+                return prefetcher.submit(self._prefetch_describes, object_names[window.start:window.stop])
+            prefetch = start_prefetch(0) if windows else None
+            while futures or next_window < len(windows):
+                if next_window < len(windows) and len(futures) <= DESCRIBE_PREFETCH_WINDOW and (prefetch.done() or not futures):
+                    prefetch.result()
+                    for i in windows[next_window]:
+                        futures[executor.submit(self._process_object, object_names[i], f"{i + 1}/{total}")] = i
+                    next_window += 1
+                    if next_window < len(windows):
+                        prefetch = start_prefetch(next_window)
+                    continue
+                # Progress is reported from this thread only, in completion order; the timeout lets a finished
+                # prefetch be noticed while slow objects are still running
+                done, _ = wait(futures, timeout=0.25, return_when=FIRST_COMPLETED)
+                for future in done:
+                    i = futures.pop(future)
+                    results[i] = future.exception() or future.result()
+                    self._release_describe(object_names[i])
+                    completed += 1
+                    if progress_callback:
+                        progress_callback(completed, total)
+        return results
     
-    def _process_object(self, obj_name: str) -> ProcessingResult:
+    def _process_object(self, obj_name: str, position: str = "") -> ProcessingResult:
         result = ProcessingResult()
+        # Workers run concurrently, so "Processing" is logged when the object actually starts
+        # and every detail line names its object
+        logging_enabled = self.status_callback is not None
+        if logging_enabled: self._log_status(f"[{position}] Processing object: {obj_name}")
+        # Unknown names are settled against the org's object list without a describe round-trip
+        if not _SAFE_IDENTIFIER(obj_name) or (self._org_object_set and obj_name not in self._org_object_set):
+            result.object_exists = False
+            return result
         try:
-            getattr(self.sf, obj_name).describe()
+            field_index = self._field_index(obj_name)
         except Exception as e:
             if 'NOT_FOUND' in str(e) or 'INVALID_TYPE' in str(e):
                 result.object_exists = False
@@ -191,141 +417,272 @@ class PicklistExporter:
         picklist_fields = self._get_picklist_fields(obj_name)
         result.picklist_fields_count = len(picklist_fields)
         if not picklist_fields: return result
-        self._log_status(f"  Found {len(picklist_fields)} picklist fields")
+        if logging_enabled: self._log_status(f"  {obj_name}: Found {len(picklist_fields)} picklist fields")
         entity_def_id = self._resolve_entity_definition_id(obj_name)
-        if entity_def_id: self._log_status(f"  EntityDefinition.Id: {entity_def_id}")
+        if entity_def_id and logging_enabled: self._log_status(f"  {obj_name}: EntityDefinition.Id: {entity_def_id}")
         
+        # FieldDefinition queries for all fields in a few batch calls; only the misses go through the per-field fallback chain
+        bulk_values = self._query_field_definitions_bulk(obj_name, list(picklist_fields))
+        
+        # Object, field and status strings repeat on every row; intern them so rows share one copy
+        obj_name = sys.intern(obj_name)
+        objs, field_labels, field_apis, value_labels, value_apis, statuses = result.columns
+        widths = result.widths
         for field_api, field_info in picklist_fields.items():
-            values = self._query_picklist_values_with_fallback(obj_name, entity_def_id, field_api)
+            if bulk_values is None:
+                values = self._query_picklist_values_with_fallback(obj_name, entity_def_id, field_api, field_index)
+            else:
+                values = bulk_values.get(field_api) or self._query_picklist_values_with_fallback(
+                    obj_name, entity_def_id, field_api, field_index, skip_field_definition=True)
             if not values: continue
-            self._log_status(f"    Field: {field_api} - {len(values)} values")
-            for value in values:
-                is_active = value.is_active if value.is_active is not None else True
-                status = 'Active' if is_active else 'Inactive'
-                if not is_active: result.inactive_values += 1
-                row = [obj_name, field_info.label, field_api, value.label, value.value, status]
-                result.rows.append(row)
-                result.values_processed += 1
+            if logging_enabled: self._log_status(f"    {obj_name} Field: {field_api} - {len(values)} values")
+            count = len(values)
+            labels, api_values, actives = zip(*values)
+            field_label = sys.intern(field_info.label)
+            objs.extend(repeat(obj_name, count))
+            field_labels.extend(repeat(field_label, count))
+            field_apis.extend(repeat(sys.intern(field_api), count))
+            value_labels.extend(labels)
+            value_apis.extend(api_values)
+            statuses.extend([_ACTIVE if is_active is None or is_active else _INACTIVE for is_active in actives])
+            widths[1] = max(widths[1], len(field_label))
+            widths[2] = max(widths[2], len(field_api))
+            widths[3] = max(widths[3], max(map(len, labels)))
+            widths[4] = max(widths[4], max(map(len, api_values)))
+        # Count once over the Status column instead of branching per value
+        result.values_processed = len(statuses)
+        result.inactive_values = statuses.count(_INACTIVE)
+        if statuses:
+            widths[0] = len(obj_name)
+            widths[5] = len(_INACTIVE if result.inactive_values else _ACTIVE)
         return result
     
+    def _describe(self, object_name: str) -> Dict:
+        """Returns the sobject describe, fetching it at most once while its object is being processed"""
+        cached = self._describe_cache.get(object_name)
+        if cached is not None:
+            return cached
+        # Same endpoint simple_salesforce would hit, but over the pooled, retrying session
+        response = self._get(self._describe_url_fmt.format(object_name))
+        if response.status_code != 200:
+            raise Exception(f"Describe failed ({response.status_code}): {response.text}")
+        obj_describe = json_loads(response.content)
+        self._describe_cache[object_name] = obj_describe
+        self._field_index_cache.pop(object_name, None)
+        return obj_describe
+    
+    def _release_describe(self, object_name: str):
+        """Drops a processed object's describe and field index; they are only reused within one object,
+        so the cache never outlives the export"""
+        self._describe_cache.pop(object_name, None)
+        self._field_index_cache.pop(object_name, None)
+    
+    def _prefetch_describes(self, object_names: List[str]):
+        """Warms the describe cache through the Composite Batch API, COMPOSITE_BATCH_SIZE objects per call.
+        Anything that fails here is simply described on demand by _describe."""
+        pending = [
+            name for name in object_names
+            if _SAFE_IDENTIFIER(name) and (not self._org_object_set or name in self._org_object_set)
+            and name not in self._describe_cache
+        ]
+        batches = [pending[start:start + COMPOSITE_BATCH_SIZE] for start in range(0, len(pending), COMPOSITE_BATCH_SIZE)]
+        if not batches: return
+        with ThreadPoolExecutor(max_workers=min(len(batches), MAX_CONCURRENT_REQUESTS)) as executor:
+            for error in executor.map(self._fetch_describe_batch, batches):
+                if error: self._log_status(f"  ERROR prefetchDescribes: {error}")
+    
+    def _fetch_describe_batch(self, object_names: List[str]) -> Optional[str]:
+        """Describes up to COMPOSITE_BATCH_SIZE objects in one Composite Batch call; returns an error message on failure"""
+        try:
+            payload = {'batchRequests': [
+                {'method': 'GET', 'url': f"v{API_VERSION}/sobjects/{name}/describe"} for name in object_names
+            ]}
+            response = self._post(self._composite_batch_url, payload)
+            if response.status_code != 200:
+                return f"{response.status_code}: {response.text}"
+            for name, sub_result in zip(object_names, json_loads(response.content).get('results', [])):
+                if sub_result.get('statusCode') == 200:
+                    self._describe_cache[name] = sub_result['result']
+                    self._field_index_cache.pop(name, None)
+        except Exception as e:
+            return str(e)
+        return None
+    
+    def _field_index(self, object_name: str) -> Dict[str, Dict]:
+        """Lowercased field name -> field describe, built once per cached describe"""
+        obj_describe = self._describe(object_name)
+        index = self._field_index_cache.get(object_name)
+        if index is None:
+            index = self._field_index_cache[object_name] = {field['name'].lower(): field for field in obj_describe.get('fields', [])}
+        return index
+    
     def _get_picklist_fields(self, object_name: str) -> Dict[str, FieldInfo]:
         fields_dict = {}
         try:
-            obj_describe = getattr(self.sf, object_name).describe()
+            obj_describe = self._describe(object_name)
             for field in obj_describe['fields']:
                 if field['type'] in ['picklist', 'multipicklist']:
                     fields_dict[field['name']] = FieldInfo(api_name=field['name'], label=field['label'])
         except Exception as e:
-            self._log_status(f"  ERROR in _get_picklist_fields: {str(e)}")
+            self._log_status(f"  ERROR in _get_picklist_fields ({object_name}): {str(e)}")
         return fields_dict
     
+    def _tooling_query(self, query: str) -> Optional[List[Dict]]:
+        """Runs a Tooling API query and returns all records (following nextRecordsUrl), or None if it was rejected"""
+        response = self._get(self._tooling_url, {'q': query})
+        records = []
+        while True:
+            if response.status_code != 200: return None
+            data = json_loads(response.content)
+            records.extend(data.get('records', []))
+            if data.get('done', True) or not data.get('nextRecordsUrl'): return records
+            response = self._get(f"{self.base_url}{data['nextRecordsUrl']}")
+    
+    def _prefetch_entity_definition_ids(self, object_names: List[str]):
+        """Resolves EntityDefinition Ids for all objects up front, a batch of names per query"""
+        pending = [name for name in object_names if name not in self._entity_def_cache and _SAFE_IDENTIFIER(name)]
+        for start in range(0, len(pending), ENTITYDEF_BATCH_SIZE):
+            batch = pending[start:start + ENTITYDEF_BATCH_SIZE]
+            try:
+                records = self._tooling_query(self._Q_ENTITYDEF_BULK.format(o=_soql_in_list(batch)))
+                if records is None: continue
+                found = {record['QualifiedApiName']: record['Id'] for record in records}
+                for name in batch:
+                    self._entity_def_cache[name] = found.get(name)
+            except Exception as e:
+                self._log_status(f"  ERROR prefetchEntityDefinitionIds: {str(e)}")
+    
     def _resolve_entity_definition_id(self, object_name: str) -> Optional[str]:
+        if object_name in self._entity_def_cache:
+            return self._entity_def_cache[object_name]
         try:
-            query = f"SELECT Id FROM EntityDefinition WHERE QualifiedApiName = '{object_name}'"
-            url = f"{self.base_url}/services/data/v{API_VERSION}/tooling/query/"
-            response = requests.get(url, headers=self.headers, params={'q': query}, timeout=60)
-            if response.status_code == 200:
-                records = response.json().get('records', [])
-                if records: return records[0]['Id']
+            records = self._tooling_query(self._Q_ENTITYDEF.format(o=_soql_escape(object_name)))
+            if records is not None:
+                entity_def_id = records[0]['Id'] if records else None
+                self._entity_def_cache[object_name] = entity_def_id
+                return entity_def_id
         except Exception as e:
-            self._log_status(f"  ERROR resolveEntityDefinitionId: {str(e)}")
+            self._log_status(f"  ERROR resolveEntityDefinitionId ({object_name}): {str(e)}")
         return None
     
-    def _query_picklist_values_with_fallback(self, object_name: str, entity_def_id: Optional[str], field_name: str) -> List[PicklistValueDetail]:
-        values = self._query_field_definition_tooling(object_name, field_name)
-        if values: return values
-        if entity_def_id:
-            values = self._query_custom_field_tooling(entity_def_id, field_name)
+    def _query_picklist_values_with_fallback(self, object_name: str, entity_def_id: Optional[str], field_name: str,
+                                             field_index: Optional[Dict[str, Dict]] = None,
+                                             skip_field_definition: bool = False) -> List[PicklistValueDetail]:
+        if not _SAFE_IDENTIFIER(field_name): return []
+        if not skip_field_definition:
+            values = self._query_field_definition_tooling(object_name, field_name)
             if values: return values
-        values = self._query_custom_field_tooling_table_enum(object_name, field_name)
-        if values: return values
-        values = self._query_rest_describe_for_picklist(object_name, field_name)
+        # CustomField only holds custom fields, so standard picklists go straight to the describe
+        if field_name.endswith('__c'):
+            if entity_def_id:
+                values = self._query_custom_field_tooling(entity_def_id, field_name)
+                if values: return values
+            values = self._query_custom_field_tooling_table_enum(object_name, field_name)
+            if values: return values
+        values = self._query_rest_describe_for_picklist(object_name, field_name, field_index)
         if values: return values
         return []
     
+    def _query_field_definitions_bulk(self, object_name: str, field_names: List[str]) -> Optional[Dict[str, List[PicklistValueDetail]]]:
+        """Fetches FieldDefinition metadata for many fields, COMPOSITE_BATCH_SIZE per Tooling Composite Batch call;
+        returns None if a batch call is rejected.
+        The Tooling API only returns Metadata from single-row queries, so a FieldDefinition IN (...) query is not an
+        option: each subrequest is the same one-field query _query_field_definition_tooling runs."""
+        values_by_field = {}
+        field_names = [name for name in field_names if _SAFE_IDENTIFIER(name)]
+        object_literal = _soql_escape(object_name)
+        try:
+            for start in range(0, len(field_names), COMPOSITE_BATCH_SIZE):
+                batch = field_names[start:start + COMPOSITE_BATCH_SIZE]
+                payload = {'batchRequests': [
+                    {'method': 'GET', 'url': f"v{API_VERSION}/tooling/query?q=" +
+                        quote(self._Q_FIELDDEF.format(o=object_literal, f=_soql_escape(name)))}
+                    for name in batch
+                ]}
+                response = self._post(self._tooling_composite_batch_url, payload)
+                if response.status_code != 200: return None
+                for name, sub_result in zip(batch, json_loads(response.content).get('results', [])):
+                    records = (sub_result.get('result') or {}).get('records') if sub_result.get('statusCode') == 200 else None
+                    if records:
+                        values = self._parse_value_set(records[0].get('Metadata') or {})
+                        if values: values_by_field[name] = values
+        except Exception as e:
+            self._log_status(f"      ERROR queryFieldDefinitionsBulk ({object_name}): {str(e)}")
+            return None
+        return values_by_field
+    
     def _query_field_definition_tooling(self, object_name: str, field_name: str) -> List[PicklistValueDetail]:
         try:
-            query = f"SELECT Metadata FROM FieldDefinition WHERE EntityDefinition.QualifiedApiName = '{object_name}' AND QualifiedApiName = '{field_name}'"
-            url = f"{self.base_url}/services/data/v{API_VERSION}/tooling/query/"
-            response = requests.get(url, headers=self.headers, params={'q': query}, timeout=60)
-            if response.status_code == 200:
-                records = response.json().get('records', [])
-                if records: return self._parse_value_set(records[0].get('Metadata', {}))
+            records = self._tooling_query(self._Q_FIELDDEF.format(o=_soql_escape(object_name), f=_soql_escape(field_name)))
+            if records: return self._parse_value_set(records[0].get('Metadata') or {})
         except Exception as e:
-            self._log_status(f"      ERROR queryFieldDefinitionTooling: {str(e)}")
+            self._log_status(f"      ERROR queryFieldDefinitionTooling ({object_name}.{field_name}): {str(e)}")
         return []
     
     def _query_custom_field_tooling(self, entity_def_id: str, field_name: str) -> List[PicklistValueDetail]:
         try:
             dev_name = field_name[:-3] if field_name.endswith('__c') else field_name
-            query = f"SELECT Metadata FROM CustomField WHERE TableEnumOrId = '{entity_def_id}' AND DeveloperName = '{dev_name}'"
-            url = f"{self.base_url}/services/data/v{API_VERSION}/tooling/query/"
-            response = requests.get(url, headers=self.headers, params={'q': query}, timeout=60)
-            if response.status_code == 200:
-                records = response.json().get('records', [])
-                if records: return self._parse_value_set(records[0].get('Metadata', {}))
+            records = self._tooling_query(self._Q_CUSTOMFIELD.format(t=_soql_escape(entity_def_id), d=_soql_escape(dev_name)))
+            if records: return self._parse_value_set(records[0].get('Metadata') or {})
         except Exception as e:
-            self._log_status(f"      ERROR queryCustomFieldTooling: {str(e)}")
+            self._log_status(f"      ERROR queryCustomFieldTooling ({entity_def_id}.{field_name}): {str(e)}")
         return []
     
     def _query_custom_field_tooling_table_enum(self, object_name: str, field_name: str) -> List[PicklistValueDetail]:
         try:
             dev_name = field_name[:-3] if field_name.endswith('__c') else field_name
-            query = f"SELECT Metadata FROM CustomField WHERE TableEnumOrId = '{object_name}' AND DeveloperName = '{dev_name}'"
-            url = f"{self.base_url}/services/data/v{API_VERSION}/tooling/query/"
-            response = requests.get(url, headers=self.headers, params={'q': query}, timeout=60)
-            if response.status_code == 200:
-                records = response.json().get('records', [])
-                if records: return self._parse_value_set(records[0].get('Metadata', {}))
+            records = self._tooling_query(self._Q_CUSTOMFIELD.format(t=_soql_escape(object_name), d=_soql_escape(dev_name)))
+            if records: return self._parse_value_set(records[0].get('Metadata') or {})
         except Exception as e:
-            self._log_status(f"      ERROR queryCustomFieldToolingTableEnum: {str(e)}")
+            self._log_status(f"      ERROR queryCustomFieldToolingTableEnum ({object_name}.{field_name}): {str(e)}")
         return []
     
-    def _query_rest_describe_for_picklist(self, object_name: str, field_name: str) -> List[PicklistValueDetail]:
+    def _query_rest_describe_for_picklist(self, object_name: str, field_name: str,
+                                          field_index: Optional[Dict[str, Dict]] = None) -> List[PicklistValueDetail]:
         try:
-            url = f"{self.base_url}/services/data/v{API_VERSION}/sobjects/{object_name}/describe"
-            response = requests.get(url, headers=self.headers, timeout=60)
-            if response.status_code == 200:
-                for field in response.json().get('fields', []):
-                    if field['name'].lower() == field_name.lower():
-                        return [PicklistValueDetail(label=pv.get('label', ''), value=pv.get('value', ''), is_active=pv.get('active', True))
-                                for pv in field.get('picklistValues', [])]
+            if field_index is None: field_index = self._field_index(object_name)
+            field = field_index.get(field_name.lower())
+            if field:
+                return [PicklistValueDetail(label=pv.get('label') or '', value=pv.get('value') or '', is_active=pv.get('active', True))
+                        for pv in field.get('picklistValues', [])]
         except Exception as e:
-            self._log_status(f"      ERROR queryRestDescribeForPicklist: {str(e)}")
+            self._log_status(f"      ERROR queryRestDescribeForPicklist ({object_name}.{field_name}): {str(e)}")
         return []
     
     def _parse_value_set(self, metadata: dict) -> List[PicklistValueDetail]:
-        results = []
-        try:
-            value_set = metadata.get('valueSet', {})
-            if not value_set: return results
-            values = value_set.get('valueSetDefinition', {}).get('value', []) or value_set.get('value', [])
-            for v in values:
-                is_active = bool(v.get('isActive', True))
-                results.append(PicklistValueDetail(label=v.get('label', ''), value=v.get('valueName') or v.get('value', ''), is_active=is_active))
-        except Exception as e:
-            self._log_status(f"      ERROR parseValueSet: {str(e)}")
-        return results
+        # Callers already guard against malformed payloads; keep this path free of try/except and global lookups
+        value_set = metadata.get('valueSet')
+        if not value_set: return []
+        definition = value_set.get('valueSetDefinition')
+        values = (definition.get('value') if definition else None) or value_set.get('value') or ()
+        detail = PicklistValueDetail
+        return [detail(v.get('label') or '', v.get('valueName') or v.get('value') or '', bool(v.get('isActive', True)))
+                for v in values]
     
-    def _create_excel_file(self, rows: List[List[str]], output_path: str) -> str:
-        wb = Workbook()
-        ws = wb.active
-        ws.title = "Picklist Export"
-        for row in rows: ws.append(row)
+    def _create_excel_file(self, column_blocks: List[Tuple[List[str], ...]], column_widths: List[int], output_path: str) -> str:
+        header = ['Object', 'Field Label', 'Field API', 'Picklist Value Label', 'Picklist Value API', 'Status']
+        # Write-only sheets need column widths before the first row; the data widths were measured per object
+        widths = list(map(max, map(len, header), column_widths))
+        
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet("Picklist Export")
+        for col_idx, max_length in enumerate(widths, 1):
+            ws.column_dimensions[get_column_letter(col_idx)].width = min(max_length + 2, 50)
+        ws.freeze_panes = "A2"
         header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
         header_font = Font(bold=True, color="FFFFFF")
-        for cell in ws[1]: cell.fill, cell.font, cell.alignment = header_fill, header_font, Alignment(horizontal="center", vertical="center")
-        for col in ws.columns:
-            max_length = 0
-            col_letter = get_column_letter(col[0].column)
-            for cell in col:
-                try: max_length = max(max_length, len(str(cell.value)))
-                except: pass
-            ws.column_dimensions[col_letter].width = min(max_length + 2, 50)
-        ws.freeze_panes = "A2"
+        header_alignment = Alignment(horizontal="center", vertical="center")
+        header_cells = []
+        for title in header:
+            cell = WriteOnlyCell(ws, value=title)
+            cell.fill, cell.font, cell.alignment = header_fill, header_font, header_alignment
+            header_cells.append(cell)
+        ws.append(header_cells)
+        for columns in column_blocks:
+            for row in zip(*columns): ws.append(row)
         wb.save(output_path)
         self._log_status(f"✅ Excel file created: {output_path}")
-        self._log_status(f"✅ Total data rows: {len(rows) - 1}")
+        self._log_status(f"✅ Total data rows: {sum(len(columns[0]) for columns in column_blocks)}")
         return output_path
 
 
@@ -340,6 +697,41 @@ def format_runtime(seconds: float) -> str:
     minutes, seconds = divmod(remainder, 60)
     return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
 
+def _object_cache_path(username: str, domain: str) -> str:
+    """Cache file for one org login; the name is hashed so usernames don't end up on disk"""
+    key = hashlib.sha1(f"{username.lower()}|{domain}".encode("utf-8")).hexdigest()
+    return os.path.join(OBJECT_CACHE_DIR, f"{key}.json")
+
+def load_object_cache(username: str, domain: str) -> Optional[List[str]]:
+    """Returns the cached org object list if it exists and is younger than OBJECT_CACHE_TTL"""
+    try:
+        with open(_object_cache_path(username, domain), "r", encoding="utf-8") as f:
+            cached = json.load(f)
+        if time.time() - cached["timestamp"] < OBJECT_CACHE_TTL and cached["objects"]:
+            return cached["objects"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    return None
+
+def save_object_cache(username: str, domain: str, objects: List[str]):
+    """Persists the org object list for faster subsequent logins (best effort)"""
+    try:
+        os.makedirs(OBJECT_CACHE_DIR, exist_ok=True)
+        with open(_object_cache_path(username, domain), "w", encoding="utf-8") as f:
+            json.dump({"timestamp": time.time(), "objects": objects}, f)
+    except OSError:
+        pass
+
+def _index_runs(indices) -> List[Tuple[int, int]]:
+    """Collapses listbox indices into (first, last) runs of consecutive rows"""
+    runs = []
+    for i in sorted(indices):
+        if runs and i == runs[-1][1] + 1:
+            runs[-1][1] = i
+        else:
+            runs.append([i, i])
+    return [(a, b) for a, b in runs]
+
 def print_statistics(stats: Dict, runtime_formatted: str, output_file: str):
     """Prints comprehensive statistics to the console"""
     print("\n" + "=" * 70)
@@ -373,11 +765,43 @@ class PicklistExportGUI(ctk.CTk):
         self.title("Salesforce Picklist Exporter")
         self.geometry("1200x720")
         self.resizable(False, False)
+        self._fonts: Dict[Tuple[int, str], ctk.CTkFont] = {}  # Shared fonts, see _f()
         
         self.sf_exporter: Optional[PicklistExporter] = None
         self.all_org_objects: List[str] = []
         self.selected_objects: Set[str] = set()
         self.current_filter = "all"  # all, standard, custom
+        self._cache_key: Tuple[str, str] = ("", "")  # (username, domain) of the current login
+        # Parallel to all_org_objects, built once per login for search/filtering
+        self._objects_lower: List[str] = []
+        self._is_custom: List[bool] = []
+        self._partition_indices: Dict[str, List[int]] = {"standard": [], "custom": []}
+        # Last search, so typing further can narrow the previous matches instead of rescanning
+        self._last_search: Optional[str] = None
+        self._last_filter = self.current_filter
+        self._last_matches: List[int] = []
+        self._available_view: List[str] = []  # Names currently shown in the Available ListBox
+        self._available_visible_count = 0  # len(_available_view), so counts don't ask Tk for size()
+        self._search_after_id = None
+        self._available_pos: Dict[str, int] = {}  # Name -> position in _available_view
+        # The Available ListBox only holds a window of _available_view starting at this offset;
+        # its selection is kept here by name so it survives the window sliding
+        self._available_offset = 0
+        self._available_picked: Set[str] = set()
+        self._available_anchor: Optional[int] = None  # Position in _available_view of the last non-Shift click
+        self._selected_sorted: List[str] = []     # Mirrors the Selected ListBox rows
+        # Status lines waiting for the next batched textbox write (appended from worker threads too);
+        # only the main-thread _flush_log loop touches the textbox
+        self._pending_log_lines: List[str] = []
+        self._log_lock = threading.Lock()
+        # (current, total) posted by the export worker; drained on the main thread by _drain_progress
+        self._progress_queue: "queue.Queue[Tuple[int, int]]" = queue.Queue()
+        self._progress_polling = False
+        self._last_export_dir: Optional[str] = None  # Save dialog reopens where the last export went
+        self.is_exporting = False
+        self._object_refresh_running = False
+        # Object refresh that finished mid-export; applied by enable_ui once the lists accept edits again
+        self._pending_object_refresh: Optional[Tuple[PicklistExporter, List[str]]] = None
         
         self.grid_rowconfigure(0, weight=1)
         self.grid_columnconfigure(0, weight=1)
@@ -392,6 +816,15 @@ class PicklistExportGUI(ctk.CTk):
         self._setup_export_frame()
         
         self.export_frame.grid_forget()
+        self.after(STATUS_FLUSH_MS, self._flush_log)
+
+    def _f(self, size: int, weight: str = "normal") -> ctk.CTkFont:
+        """Returns one shared CTkFont per (size, weight) instead of a new Tcl font per widget"""
+        key = (size, weight)
+        font = self._fonts.get(key)
+        if font is None:
+            font = self._fonts[key] = ctk.CTkFont(size=size, weight=weight)
+        return font
 
     # ==================================
     # Screen 1: Login & Authentication
@@ -401,10 +834,10 @@ class PicklistExportGUI(ctk.CTk):
         login_frame = self.login_frame
         login_frame.columnconfigure(1, weight=1)
         
-        ctk.CTkLabel(login_frame, text="Salesforce Login", font=ctk.CTkFont(size=30, weight="bold")).grid(row=0, column=0, columnspan=2, pady=(50, 40))
+        ctk.CTkLabel(login_frame, text="Salesforce Login", font=self._f(30, "bold")).grid(row=0, column=0, columnspan=2, pady=(50, 40))
 
         def create_input_row(parent, row, label_text, password_mode=False):
-            ctk.CTkLabel(parent, text=label_text, anchor="w", font=ctk.CTkFont(size=14)).grid(row=row, column=0, padx=10, pady=15, sticky="w")
+            ctk.CTkLabel(parent, text=label_text, anchor="w", font=self._f(14)).grid(row=row, column=0, padx=10, pady=15, sticky="w")
             entry = ctk.CTkEntry(parent, width=350, show="*" if password_mode else "")
             entry.grid(row=row, column=1, padx=10, pady=15, sticky="ew")
             return entry
@@ -413,7 +846,7 @@ class PicklistExportGUI(ctk.CTk):
         self.password_entry = create_input_row(login_frame, 2, "Password:", password_mode=True)
         self.token_entry = create_input_row(login_frame, 3, "Security Token:", password_mode=True)
 
-        ctk.CTkLabel(login_frame, text="Org Type:", anchor="w", font=ctk.CTkFont(size=14)).grid(row=4, column=0, padx=10, pady=15, sticky="w")
+        ctk.CTkLabel(login_frame, text="Org Type:", anchor="w", font=self._f(14)).grid(row=4, column=0, padx=10, pady=15, sticky="w")
         self.org_type_var = ctk.StringVar(value="Production")
         radio_prod = ctk.CTkRadioButton(login_frame, text="Production", variable=self.org_type_var, value="Production")
         radio_test = ctk.CTkRadioButton(login_frame, text="Sandbox/Test", variable=self.org_type_var, value="Sandbox")
@@ -421,8 +854,13 @@ class PicklistExportGUI(ctk.CTk):
         radio_prod.grid(row=4, column=1, padx=(10, 5), pady=15, sticky="w")
         radio_test.grid(row=4, column=1, padx=(140, 10), pady=15, sticky="w")
         
-        self.login_button = ctk.CTkButton(login_frame, text="Login to Salesforce", command=self.login_action, height=50, font=ctk.CTkFont(size=16, weight="bold"))
-        self.login_button.grid(row=5, column=0, columnspan=2, pady=50, sticky="ew", padx=10)
+        self.login_button = ctk.CTkButton(login_frame, text="Login to Salesforce", command=self.login_action, height=50, font=self._f(16, "bold"))
+        self.login_button.grid(row=5, column=0, columnspan=2, pady=(50, 10), sticky="ew", padx=10)
+        
+        # Shown only while the background login is running
+        self.login_progress = ctk.CTkProgressBar(login_frame, mode="indeterminate", height=8)
+        self.login_progress.grid(row=6, column=0, columnspan=2, sticky="ew", padx=10)
+        self.login_progress.grid_remove()
 
     def login_action(self):
         self.login_button.configure(state="disabled", text="Connecting...")
@@ -437,29 +875,111 @@ class PicklistExportGUI(ctk.CTk):
             self.login_button.configure(state="normal", text="Login to Salesforce")
             return
 
+        self.login_progress.grid()
+        self.login_progress.start()
+        
+        # Authentication and the org-wide describe can take a while; keep the window responsive
+        login_thread = threading.Thread(
+            target=self._do_login,
+            args=(username, password, token, domain),
+            daemon=True
+        )
+        login_thread.start()
+
+    def _do_login(self, username: str, password: str, token: str, domain: str):
+        """Background thread for login and object list retrieval"""
         try:
-            self.sf_exporter = PicklistExporter(
+            # A fresh on-disk object list skips the org-wide describe; it is revalidated in the background
+            cached_objects = load_object_cache(username, domain)
+            exporter = PicklistExporter(
                 username=username, 
                 password=password, 
                 security_token=token, 
                 domain=domain,
-                status_callback=self.update_status
+                status_callback=self.update_status,
+                fetch_objects=cached_objects is None
             )
+            if cached_objects is None:
+                objects = exporter.get_all_objects()
+                save_object_cache(username, domain, objects)
+            else:
+                objects = cached_objects
             
-            messagebox.showinfo("Success", "Successfully connected to Salesforce!")
-            
-            self.all_org_objects = self.sf_exporter.get_all_objects()
-            
-            self.login_frame.grid_forget()
-            self.export_frame.grid(row=0, column=0, sticky="nsew", padx=20, pady=20)
-            self.populate_available_objects(self.all_org_objects)
-            self.populate_selected_objects()
-            self.update_object_counts()
+            self.after(0, self._login_success, exporter, objects, cached_objects is not None, (username, domain))
             
         except Exception as e:
-            messagebox.showerror("Login Failed", f"Connection Error: {str(e)}")
-            self.sf_exporter = None
-            self.login_button.configure(state="normal", text="Login to Salesforce")
+            self.after(0, self._login_error, str(e))
+
+    def _login_success(self, exporter: PicklistExporter, objects: List[str], from_cache: bool, cache_key: Tuple[str, str]):
+        """Called on the main thread when the background login succeeds"""
+        self.login_progress.stop()
+        self.login_progress.grid_remove()
+        self.sf_exporter = exporter
+        self._cache_key = cache_key
+        
+        messagebox.showinfo("Success", "Successfully connected to Salesforce!")
+        
+        self.all_org_objects = objects
+        if from_cache:
+            self.update_status(f"✓ Loaded {len(objects)} objects from cache. Refreshing in background...")
+            self._start_object_refresh()
+        self._index_org_objects()
+        
+        self.login_frame.grid_forget()
+        self.export_frame.grid(row=0, column=0, sticky="nsew", padx=20, pady=20)
+        self.populate_available_objects(self.all_org_objects)
+        self.populate_selected_objects()
+        self.update_object_counts()
+
+    def _login_error(self, error_message: str):
+        """Called on the main thread when the background login fails"""
+        self.login_progress.stop()
+        self.login_progress.grid_remove()
+        messagebox.showerror("Login Failed", f"Connection Error: {error_message}")
+        self.sf_exporter = None
+        self.login_button.configure(state="normal", text="Login to Salesforce")
+
+    def refresh_objects_action(self):
+        """Re-fetches the org object list regardless of the on-disk cache."""
+        if not self.sf_exporter:
+            return
+        self.update_status("Refreshing object list from Salesforce...")
+        self._start_object_refresh()
+
+    def _start_object_refresh(self):
+        self._object_refresh_running = True
+        self.refresh_button.configure(state="disabled")
+        threading.Thread(target=self._refresh_objects, args=(self.sf_exporter,), daemon=True).start()
+
+    def _refresh_objects(self, exporter: PicklistExporter):
+        """Background thread: fetches the object list and hands it back to the main thread"""
+        objects = exporter.refresh_all_objects()
+        self.after(0, self._apply_refreshed_objects, exporter, objects)
+
+    def _apply_refreshed_objects(self, exporter: PicklistExporter, objects: List[str]):
+        """Called on the main thread once a background object refresh completes"""
+        self._object_refresh_running = False
+        if self.is_exporting:
+            # The ListBoxes are disabled and would silently ignore the repopulation
+            self._pending_object_refresh = (exporter, objects)
+            return
+        self.refresh_button.configure(state="normal")
+        # Ignore results for a session that was logged out meanwhile, and empty (failed) fetches
+        if exporter is not self.sf_exporter or not objects:
+            return
+        save_object_cache(*self._cache_key, objects)
+        if objects == self.all_org_objects:
+            self.update_status("✓ Object list is up to date.")
+            return
+        
+        self.all_org_objects = objects
+        self._index_org_objects()
+        self.selected_objects &= set(objects)
+        self._selected_sorted = [obj for obj in self._selected_sorted if obj in self.selected_objects]
+        self.populate_selected_objects()
+        self._do_filter()
+        self.update_object_counts()
+        self.update_status(f"✓ Object list refreshed: {len(objects)} objects.")
 
     # ==================================
     # Screen 2: Object Selection & Export
@@ -475,7 +995,7 @@ class PicklistExportGUI(ctk.CTk):
         header_frame.grid(row=0, column=0, pady=(10, 5), sticky="ew", padx=10)
         header_frame.columnconfigure(1, weight=1)
         
-        ctk.CTkLabel(header_frame, text="Salesforce Picklist Exporter", font=ctk.CTkFont(size=28, weight="bold")).grid(row=0, column=0, sticky="w")
+        ctk.CTkLabel(header_frame, text="Salesforce Picklist Exporter", font=self._f(28, "bold")).grid(row=0, column=0, sticky="w")
         
         # Theme toggle button
         self.theme_toggle = ctk.CTkButton(
@@ -484,12 +1004,15 @@ class PicklistExportGUI(ctk.CTk):
             command=self.toggle_theme, 
             width=40,
             height=40,
-            font=ctk.CTkFont(size=20)
+            font=self._f(20)
         )
         self.theme_toggle.grid(row=0, column=1, sticky="e", padx=(0, 10))
         
+        self.refresh_button = ctk.CTkButton(header_frame, text="⟳ Refresh", command=self.refresh_objects_action, width=100, height=40)
+        self.refresh_button.grid(row=0, column=2, sticky="e", padx=(0, 10))
+        
         self.logout_button = ctk.CTkButton(header_frame, text="Logout", command=self.logout_action, width=100, fg_color="#CC3333", height=40)
-        self.logout_button.grid(row=0, column=2, sticky="e")
+        self.logout_button.grid(row=0, column=3, sticky="e")
 
         # Object selection panel
         selection_frame = ctk.CTkFrame(export_frame)
@@ -505,9 +1028,9 @@ class PicklistExportGUI(ctk.CTk):
         available_frame.grid_rowconfigure(3, weight=1)
         available_frame.grid_columnconfigure(0, weight=1)
         
-        ctk.CTkLabel(available_frame, text="Available Objects", font=ctk.CTkFont(size=16, weight="bold")).grid(row=0, column=0, pady=(5, 2))
+        ctk.CTkLabel(available_frame, text="Available Objects", font=self._f(16, "bold")).grid(row=0, column=0, pady=(5, 2))
         
-        self.available_count_label = ctk.CTkLabel(available_frame, text="(0 objects)", font=ctk.CTkFont(size=11))
+        self.available_count_label = ctk.CTkLabel(available_frame, text="(0 objects)", font=self._f(11))
         self.available_count_label.grid(row=1, column=0, pady=(0, 5))
         
         # Filter buttons
@@ -530,20 +1053,30 @@ class PicklistExportGUI(ctk.CTk):
         self.available_listbox = tk.Listbox(
             available_frame, selectmode="extended", height=10, exportselection=False,
             font=("Arial", 11), borderwidth=0, highlightthickness=0,
-            selectbackground="#1F538D", fg="white", background="#2B2B2B"
+            selectbackground="#1F538D", fg="white", background="#2B2B2B",
+            yscrollcommand=self._on_available_yview
         )
         self.available_listbox.grid(row=4, column=0, padx=5, pady=(0, 5), sticky="nsew")
+        self.available_listbox.bind("<Button-1>", self._on_available_click)
+        self.available_listbox.bind("<<ListboxSelect>>", self._sync_available_picks)
+        # Scrollbar spans the whole filtered list, not just the rows currently in the ListBox
+        self.available_scrollbar = ctk.CTkScrollbar(available_frame, command=self._on_available_scroll)
+        self.available_scrollbar.grid(row=4, column=1, pady=(0, 5), sticky="ns")
 
         # MIDDLE: Action buttons
         action_frame = ctk.CTkFrame(selection_frame, fg_color="transparent")
         action_frame.grid(row=0, column=1, padx=3, pady=5)
         
-        ctk.CTkLabel(action_frame, text="Actions", font=ctk.CTkFont(size=13, weight="bold")).pack(pady=5)
+        ctk.CTkLabel(action_frame, text="Actions", font=self._f(13, "bold")).pack(pady=5)
         
-        ctk.CTkButton(action_frame, text="Add >>", command=self.add_selected_to_export, height=30, width=90).pack(pady=3, padx=3)
-        ctk.CTkButton(action_frame, text="<< Remove", command=self.remove_selected_from_export, height=30, width=90).pack(pady=3, padx=3)
-        ctk.CTkButton(action_frame, text="Select All", command=self.select_all_available, height=30, width=90).pack(pady=(15, 3), padx=3)
-        ctk.CTkButton(action_frame, text="Deselect All", command=self.deselect_all_available, height=30, width=90).pack(pady=3, padx=3)
+        self.add_button = ctk.CTkButton(action_frame, text="Add >>", command=self.add_selected_to_export, height=30, width=90)
+        self.add_button.pack(pady=3, padx=3)
+        self.remove_button = ctk.CTkButton(action_frame, text="<< Remove", command=self.remove_selected_from_export, height=30, width=90)
+        self.remove_button.pack(pady=3, padx=3)
+        self.select_all_button = ctk.CTkButton(action_frame, text="Select All", command=self.select_all_available, height=30, width=90)
+        self.select_all_button.pack(pady=(15, 3), padx=3)
+        self.deselect_all_button = ctk.CTkButton(action_frame, text="Deselect All", command=self.deselect_all_available, height=30, width=90)
+        self.deselect_all_button.pack(pady=3, padx=3)
 
         # RIGHT: Selected Objects
         selected_frame = ctk.CTkFrame(selection_frame)
@@ -551,9 +1084,9 @@ class PicklistExportGUI(ctk.CTk):
         selected_frame.grid_rowconfigure(2, weight=1)
         selected_frame.grid_columnconfigure(0, weight=1)
         
-        ctk.CTkLabel(selected_frame, text="Selected for Export", font=ctk.CTkFont(size=16, weight="bold")).grid(row=0, column=0, pady=(5, 2))
+        ctk.CTkLabel(selected_frame, text="Selected for Export", font=self._f(16, "bold")).grid(row=0, column=0, pady=(5, 2))
         
-        self.selected_count_label = ctk.CTkLabel(selected_frame, text="(0 selected)", font=ctk.CTkFont(size=11))
+        self.selected_count_label = ctk.CTkLabel(selected_frame, text="(0 selected)", font=self._f(11))
         self.selected_count_label.grid(row=1, column=0, pady=(0, 5))
         
         self.selected_listbox = tk.Listbox(
@@ -571,7 +1104,7 @@ class PicklistExportGUI(ctk.CTk):
             height=45, 
             fg_color="#28a745",
             hover_color="#218838",
-            font=ctk.CTkFont(size=15, weight="bold")
+            font=self._f(15, "bold")
         )
         self.export_button.grid(row=2, column=0, pady=(5, 5), sticky="ew", padx=10)
 
@@ -579,7 +1112,7 @@ class PicklistExportGUI(ctk.CTk):
         self.status_bar = ctk.CTkLabel(
             export_frame, 
             text="Status: Ready", 
-            font=ctk.CTkFont(size=12),
+            font=self._f(12),
             fg_color="#28a745",
             height=30,
             anchor="w",
@@ -618,19 +1151,32 @@ class PicklistExportGUI(ctk.CTk):
             self.selected_listbox.configure(fg="white", background="#2B2B2B")
     
     def update_status(self, message: str, verbose: bool = False):
-        """Updates the GUI status text box with new messages"""
+        """Queues a status message; the text box is updated in batches by _flush_log.
+        Safe to call from any thread: it never touches Tk."""
         timestamp = datetime.now().strftime("[%H:%M:%S]")
         display_message = f"{timestamp} {message}"
         
-        self.status_textbox.configure(state="normal")
-        self.status_textbox.insert("end", "\n" + display_message)
-        self.status_textbox.see("end")
-        
         if not verbose:
             print(display_message) 
 
+        with self._log_lock:
+            self._pending_log_lines.append(display_message)
+
+    def _flush_log(self):
+        """Main-thread loop: writes all pending status lines to the text box in a single update every STATUS_FLUSH_MS"""
+        self.after(STATUS_FLUSH_MS, self._flush_log)
+        with self._log_lock:
+            lines, self._pending_log_lines = self._pending_log_lines, []
+        if not lines:
+            return
+        self.status_textbox.configure(state="normal")
+        self.status_textbox.insert("end", "\n" + "\n".join(lines))
+        # Keep the Text widget bounded so long exports don't slow down layout and scrolling
+        line_count = int(self.status_textbox.index("end-1c").split(".")[0])
+        if line_count > STATUS_MAX_LINES:
+            self.status_textbox.delete("1.0", f"{line_count - STATUS_MAX_LINES + 1}.0")
+        self.status_textbox.see("end")
         self.status_textbox.configure(state="disabled")
-        self.update_idletasks()
     
     def update_status_bar(self, message: str, color: str = "#28a745"):
         """Updates the status bar with a message and color"""
@@ -638,12 +1184,29 @@ class PicklistExportGUI(ctk.CTk):
         self.update_idletasks()
     
     def update_progress(self, current: int, total: int):
-        """Updates the progress bar"""
+        """Updates the progress bar (main thread only)"""
         if total > 0:
             progress = current / total
             self.progress_bar.set(progress)
             self.update_status_bar(f"Processing {current}/{total} objects...", "#FFA500")
-        self.update_idletasks()
+
+    def _queue_progress(self, current: int, total: int):
+        """Progress callback for the export worker: Tk isn't thread-safe, so just hand the numbers over"""
+        self._progress_queue.put((current, total))
+
+    def _drain_progress(self):
+        """Applies only the latest queued progress update, then polls again while the export runs"""
+        latest = None
+        try:
+            while True:
+                latest = self._progress_queue.get_nowait()
+        except queue.Empty:
+            pass
+        if not self._progress_polling:
+            return
+        if latest is not None:
+            self.update_progress(*latest)
+        self.after(PROGRESS_POLL_MS, self._drain_progress)
 
     # --- Object List Management Methods ---
 
@@ -656,47 +1219,161 @@ class PicklistExportGUI(ctk.CTk):
         self.filter_standard_btn.configure(fg_color="gray" if filter_type != "standard" else None)
         self.filter_custom_btn.configure(fg_color="gray" if filter_type != "custom" else None)
         
-        self.filter_available_objects(None)
+        self._do_filter()
     
-    def get_filtered_objects(self) -> List[str]:
-        """Get objects based on current filter"""
-        if self.current_filter == "standard":
-            return [obj for obj in self.all_org_objects if not obj.endswith('__c')]
-        elif self.current_filter == "custom":
-            return [obj for obj in self.all_org_objects if obj.endswith('__c')]
-        else:
-            return self.all_org_objects
+    def _index_org_objects(self):
+        """Caches lowercased names and custom-object flags alongside all_org_objects"""
+        # Interned once here, so every list, set and dict below shares one string per object name
+        self.all_org_objects = [sys.intern(obj) for obj in self.all_org_objects]
+        self._objects_lower = [obj.lower() for obj in self.all_org_objects]
+        self._is_custom = [obj.endswith('__c') for obj in self.all_org_objects]
+        # The object list doesn't change until the next login, so partition it once;
+        # compress() walks the precomputed masks in C instead of a Python-level loop
+        is_standard = [not is_custom for is_custom in self._is_custom]
+        positions = range(len(self.all_org_objects))
+        self._partition_indices = {
+            "standard": list(compress(positions, is_standard)),
+            "custom": list(compress(positions, self._is_custom)),
+        }
+        self._last_search = None
+        self._last_matches = []
+        self._available_view = self.all_org_objects
 
     def populate_available_objects(self, objects: List[str]):
         """Populates the Left ListBox based on the current search filter."""
+        self._available_view = objects
+        self._available_pos = {obj: idx for idx, obj in enumerate(objects)}
+        self._available_visible_count = len(objects)
+        self._available_picked.clear()
+        self._available_anchor = None
+        self._render_available_window(0)
+
+    def _render_available_window(self, offset: int):
+        """Loads the AVAILABLE_WINDOW_ROWS rows of _available_view starting at offset into the Left ListBox."""
+        self._available_offset = offset
+        rows = self._available_view[offset:offset + AVAILABLE_WINDOW_ROWS]
         self.available_listbox.delete(0, END)
-        for obj in objects:
-            self.available_listbox.insert(END, obj)
-            if obj in self.selected_objects:
-                idx = self.available_listbox.get(0, END).index(obj)
-                self.available_listbox.itemconfig(idx, {'fg': '#87CEEB'})
+        # One Tcl call for the whole window instead of one per object
+        self.available_listbox.insert(END, *rows)
+        selected, picked = self.selected_objects, self._available_picked
+        for idx, obj in enumerate(rows):
+            if obj in selected:
+                self.available_listbox.itemconfig(idx, {'fg': SELECTED_OBJECT_FG})
+        for a, b in _index_runs([idx for idx, obj in enumerate(rows) if obj in picked]):
+            self.available_listbox.select_set(a, b)
+        # Keep Tk's own anchor (used by Shift+arrow keys) on the same object after a slide
+        anchor = self._available_anchor
+        if anchor is not None and offset <= anchor < offset + len(rows):
+            self.available_listbox.selection_anchor(anchor - offset)
+
+    def _on_available_yview(self, first, last):
+        """ListBox yscrollcommand: maps the window's view onto the full list and slides the window at its edges."""
+        total = len(self._available_view)
+        offset = self._available_offset
+        shown = min(AVAILABLE_WINDOW_ROWS, total - offset)
+        first, last = float(first), float(last)
+        if total:
+            self.available_scrollbar.set((offset + first * shown) / total, (offset + last * shown) / total)
+        else:
+            self.available_scrollbar.set(0.0, 1.0)
+        # Scrolled to the top/bottom of the window with more rows beyond it: recentre the window
+        if first <= 0.0 and offset > 0:
+            self._slide_available_window(offset, max(0, offset - AVAILABLE_WINDOW_ROWS // 2))
+        elif last >= 1.0 and offset + shown < total:
+            top = offset + int(first * shown)
+            self._slide_available_window(top, min(total - AVAILABLE_WINDOW_ROWS, offset + AVAILABLE_WINDOW_ROWS // 2))
+
+    def _slide_available_window(self, top: int, offset: int):
+        """Re-renders the window at offset, keeping row top of _available_view at the top of the view."""
+        # A disabled ListBox ignores delete/insert, so sliding now would desync _available_offset from its rows
+        if self.available_listbox.cget("state") == "disabled":
+            return
+        self._render_available_window(offset)
+        self.available_listbox.yview(top - offset)
+
+    def _on_available_scroll(self, *args):
+        """Scrollbar command: jumps the window for drags ('moveto'), lets the ListBox handle arrow/page steps."""
+        if args and args[0] == "moveto":
+            total = len(self._available_view)
+            top = min(int(float(args[1]) * total), max(0, total - 1))
+            self._slide_available_window(top, max(0, min(top, total - AVAILABLE_WINDOW_ROWS)))
+        else:
+            self.available_listbox.yview(*args)
+
+    def _on_available_click(self, event):
+        """Runs before Tk's own click handling: a plain click replaces every pick, including those outside
+        the window; Shift-click picks the range from the anchor, which may have scrolled out of the window."""
+        if self.available_listbox.cget("state") == "disabled" or not self._available_view:
+            return None
+        offset = self._available_offset
+        row = offset + self.available_listbox.nearest(event.y)
+        if event.state & EVENT_SHIFT_MASK and self._available_anchor is not None:
+            low, high = sorted((self._available_anchor, row))
+            self._available_picked.clear()
+            self._available_picked.update(self._available_view[low:high + 1])
+            self.available_listbox.select_clear(0, END)
+            window_low, window_high = max(low, offset) - offset, min(high, offset + AVAILABLE_WINDOW_ROWS - 1) - offset
+            if window_low <= window_high:
+                self.available_listbox.select_set(window_low, window_high)
+            return "break"
+        if not event.state & EVENT_CONTROL_MASK:
+            self._available_picked.clear()
+        self._available_anchor = row
+        return None
+
+    def _sync_available_picks(self, event=None):
+        """Records the window's ListBox selection by name so it persists while the window slides."""
+        offset = self._available_offset
+        rows = self._available_view[offset:offset + AVAILABLE_WINDOW_ROWS]
+        self._available_picked.difference_update(rows)
+        self._available_picked.update(rows[i] for i in self.available_listbox.curselection())
 
     def populate_selected_objects(self):
-        """Populates the Right ListBox from the internal selected_objects set (always sorted)."""
+        """Populates the Right ListBox from _selected_sorted, which add/remove keep in sorted order."""
         self.selected_listbox.delete(0, END)
-        for obj in sorted(list(self.selected_objects)):
-            self.selected_listbox.insert(END, obj)
+        self.selected_listbox.insert(END, *self._selected_sorted)
+
+    def _recolor_available(self, objects: List[str], color: str):
+        """Recolors just the given objects' rows in the Available ListBox ('' restores the default)"""
+        positions, offset = self._available_pos, self._available_offset
+        for obj in objects:
+            idx = positions.get(obj)
+            # Rows outside the loaded window get their color when the window slides over them
+            if idx is not None and offset <= idx < offset + AVAILABLE_WINDOW_ROWS:
+                self.available_listbox.itemconfig(idx - offset, {'fg': color})
 
     def filter_available_objects(self, event):
+        """Debounces search keystrokes so only the last one in a burst runs the filter."""
+        if self._search_after_id:
+            self.after_cancel(self._search_after_id)
+        self._search_after_id = self.after(SEARCH_DEBOUNCE_MS, self._do_filter)
+
+    def _do_filter(self):
         """Filters the Available ListBox based on the search entry content and current filter."""
+        self._search_after_id = None
         search_term = self.search_entry.get().lower()
-        base_objects = self.get_filtered_objects()
+        same_filter = self.current_filter == self._last_filter
+        if same_filter and search_term == self._last_search:
+            return
         
-        filtered_objects = [
-            obj for obj in base_objects
-            if search_term in obj.lower()
-        ]
-        self.populate_available_objects(filtered_objects)
+        objects_lower = self._objects_lower
+        if same_filter and self._last_search is not None and search_term.startswith(self._last_search):
+            # Typing extended the term: only the previous matches can still match
+            matches = [i for i in self._last_matches if search_term in objects_lower[i]]
+        elif self.current_filter == "all":
+            # One pass over the cached arrays: no per-keystroke lower() or suffix checks
+            matches = [i for i, obj_lower in enumerate(objects_lower) if search_term in obj_lower]
+        else:
+            matches = [i for i in self._partition_indices[self.current_filter] if search_term in objects_lower[i]]
+        self._last_search, self._last_filter, self._last_matches = search_term, self.current_filter, matches
+        
+        all_objects = self.all_org_objects
+        self.populate_available_objects([all_objects[i] for i in matches])
         self.update_object_counts()
     
     def update_object_counts(self):
         """Update the count labels"""
-        available_count = self.available_listbox.size()
+        available_count = self._available_visible_count
         selected_count = len(self.selected_objects)
         
         self.available_count_label.configure(text=f"({available_count} objects)")
@@ -704,53 +1381,61 @@ class PicklistExportGUI(ctk.CTk):
     
     def add_selected_to_export(self):
         """Adds selected objects from the Available List to the Export Set."""
-        selected_indices = self.available_listbox.curselection()
+        # The ListBoxes are disabled during an export and would ignore the in-place inserts
+        if self.is_exporting: return
+        picked = self._available_picked
         
-        if not selected_indices:
+        if not picked:
             messagebox.showwarning("Selection", "Please select one or more objects from the 'Available Objects' list to add.")
             return
 
-        added_count = 0
-        for i in selected_indices:
-            obj_name = self.available_listbox.get(i)
+        added_objects = []
+        for obj_name in (obj for obj in self._available_view if obj in picked):
             if obj_name not in self.selected_objects:
                 self.selected_objects.add(obj_name)
-                added_count += 1
+                added_objects.append(obj_name)
         
-        if added_count > 0:
-            self.populate_selected_objects()
-            self.filter_available_objects(None)
-            self.update_status(f"✓ Added {added_count} object(s) to export list.")
+        if added_objects:
+            # Insert only the new rows at their sorted positions instead of rebuilding both lists
+            for obj_name in added_objects:
+                pos = bisect.bisect_left(self._selected_sorted, obj_name)
+                self._selected_sorted.insert(pos, obj_name)
+                self.selected_listbox.insert(pos, obj_name)
+            self._recolor_available(added_objects, SELECTED_OBJECT_FG)
+            self.update_status(f"✓ Added {len(added_objects)} object(s) to export list.")
             self.update_object_counts()
 
     def remove_selected_from_export(self):
         """Removes selected objects from the Selected List and the Export Set."""
+        if self.is_exporting: return
         selected_indices = self.selected_listbox.curselection()
         
         if not selected_indices:
             messagebox.showwarning("Selection", "Please select one or more objects from the 'Selected for Export' list to remove.")
             return
 
+        # _selected_sorted mirrors the listbox, so names come from it without a Tcl round-trip;
+        # rows are deleted one contiguous run at a time, bottom up so earlier indices stay valid
         removed_objects = []
-        for i in reversed(selected_indices):
-            obj_name = self.selected_listbox.get(i)
-            removed_objects.append(obj_name)
-        
-        for obj_name in removed_objects:
-            self.selected_objects.discard(obj_name)
+        for a, b in reversed(_index_runs(selected_indices)):
+            removed_objects.extend(self._selected_sorted[a:b + 1])
+            del self._selected_sorted[a:b + 1]
+            self.selected_listbox.delete(a, b)
+        self.selected_objects.difference_update(removed_objects)
         
         if removed_objects:
-            self.populate_selected_objects()
-            self.filter_available_objects(None)
+            self._recolor_available(removed_objects, "")
             self.update_status(f"✓ Removed {len(removed_objects)} object(s) from export list.")
             self.update_object_counts()
 
     def select_all_available(self):
         """Selects all objects currently visible in the Available ListBox."""
+        self._available_picked.update(self._available_view)
         self.available_listbox.select_set(0, END)
     
     def deselect_all_available(self):
         """Deselects all objects currently visible in the Available ListBox."""
+        self._available_picked.clear()
         self.available_listbox.select_clear(0, END)
 
     # --- Action Methods ---
@@ -761,7 +1446,9 @@ class PicklistExportGUI(ctk.CTk):
         if confirm:
             self.sf_exporter = None
             self.selected_objects.clear()
+            self._selected_sorted.clear()
             self.all_org_objects.clear()
+            self._index_org_objects()
             
             self.login_button.configure(state="normal", text="Login to Salesforce") 
             self.update_status("✓ Logged out successfully. Please log in again.")
@@ -775,27 +1462,31 @@ class PicklistExportGUI(ctk.CTk):
             messagebox.showerror("Error", "Not logged in. Please log in first.")
             return
 
-        selected_objects_list = sorted(list(self.selected_objects))
+        selected_objects_list = list(self._selected_sorted)
 
         if not selected_objects_list:
             messagebox.showwarning("Warning", "The 'Selected for Export' list is empty. Please add objects.")
             return
 
-        default_filename = f'Picklist_Export_{datetime.now().strftime("%Y%m%d_%H%M%S")}.xlsx'
+        # Dialog runs before disable_ui(); initialdir=None is dropped by tkinter, so first use falls back to the default
         output_file_path = filedialog.asksaveasfilename(
             defaultextension=".xlsx",
-            initialfile=default_filename,
+            initialdir=self._last_export_dir,
+            initialfile=f'Picklist_Export_{datetime.now().strftime("%Y%m%d_%H%M%S")}.xlsx',
             filetypes=[("Excel files", "*.xlsx")]
         )
         
         if not output_file_path:
             return
+        self._last_export_dir = os.path.dirname(output_file_path)
 
         # Disable all interactive elements
         self.disable_ui()
         self.export_button.configure(text="Exporting... Please Wait")
         self.update_status_bar("Export in progress...", "#FFA500")
         self.progress_bar.set(0)
+        self._progress_polling = True
+        self.after(PROGRESS_POLL_MS, self._drain_progress)
         
         # Run export in background thread
         export_thread = threading.Thread(
@@ -815,7 +1506,7 @@ class PicklistExportGUI(ctk.CTk):
             output_path, stats = self.sf_exporter.export_picklists(
                 selected_objects_list, 
                 output_file_path,
-                progress_callback=self.update_progress
+                progress_callback=self._queue_progress
             )
             
             end_time = time.time()
@@ -829,6 +1520,7 @@ class PicklistExportGUI(ctk.CTk):
 
     def _export_complete_success(self, output_path: str, stats: Dict, runtime_formatted: str):
         """Called when export completes successfully"""
+        self._progress_polling = False
         self.update_status(f"\n{'='*60}")
         self.update_status(f"✅ EXPORT COMPLETED SUCCESSFULLY!")
         self.update_status(f"{'='*60}")
@@ -853,6 +1545,7 @@ class PicklistExportGUI(ctk.CTk):
 
     def _export_complete_error(self, error_message: str):
         """Called when export fails"""
+        self._progress_polling = False
         self.update_status(f"\n❌ FATAL EXPORT ERROR: {error_message}\n")
         self.update_status_bar("Export failed!", "#CC3333")
         
@@ -864,10 +1557,15 @@ class PicklistExportGUI(ctk.CTk):
     def disable_ui(self):
         """Disable all interactive UI elements during export"""
         self.available_listbox.configure(state="disabled")
+        self.available_scrollbar.configure(command=None)  # CTkScrollbar has no state option
         self.selected_listbox.configure(state="disabled")
+        for button in (self.add_button, self.remove_button, self.select_all_button, self.deselect_all_button):
+            button.configure(state="disabled")
         self.search_entry.configure(state="disabled")
         self.export_button.configure(state="disabled")
         self.logout_button.configure(state="disabled")
+        self.refresh_button.configure(state="disabled")
+        self.is_exporting = True
         self.theme_toggle.configure(state="disabled")
         self.filter_all_btn.configure(state="disabled")
         self.filter_standard_btn.configure(state="disabled")
@@ -877,15 +1575,24 @@ class PicklistExportGUI(ctk.CTk):
     def enable_ui(self):
         """Re-enable all interactive UI elements after export"""
         self.available_listbox.configure(state="normal")
+        self.available_scrollbar.configure(command=self._on_available_scroll)
         self.selected_listbox.configure(state="normal")
+        for button in (self.add_button, self.remove_button, self.select_all_button, self.deselect_all_button):
+            button.configure(state="normal")
         self.search_entry.configure(state="normal")
         self.export_button.configure(state="normal")
         self.logout_button.configure(state="normal")
+        if not self._object_refresh_running:
+            self.refresh_button.configure(state="normal")
         self.theme_toggle.configure(state="normal")
         self.filter_all_btn.configure(state="normal")
         self.filter_standard_btn.configure(state="normal")
         self.filter_custom_btn.configure(state="normal")
         self.configure(cursor="")
+        self.is_exporting = False
+        if self._pending_object_refresh:
+            pending, self._pending_object_refresh = self._pending_object_refresh, None
+            self._apply_refreshed_objects(*pending)
 
 # ===========================================
 # MAIN EXECUTION